@@ -0,0 +1,170 @@
+"""
+Render-path benchmarks.
+
+Draws each path on its own at increasing entity counts, under the SDL dummy
+video driver (no window, software surface): every enemy class, player towers
+(range circles included), projectiles, the HUD, the upgrade overlay and a
+full ``_draw_game`` frame, flipped or in dirty-rect mode. Reports ms per
+frame and the growth order; results go to JSON like ``bench_sim.py``.
+
+    python bench_render.py                        # writes bench_render.json
+    python bench_render.py --counts 50 400 --cases enemy:star towers
+    python bench_render.py --check                # dirty-rect frames == full ones
+"""
+
+import argparse, json, math, os, platform, random, statistics, time
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from config     import WIDTH, HEIGHT
+from enemy      import spawn_enemy
+from projectile import ProjectileStore
+from tower      import PlayerTower
+from state      import GameState
+from dirty      import DirtyRects
+from bench_sim  import ENEMY_TYPES, IDLE, build_scenario, fit_order, git_commit
+
+
+# ──────────────────────────────────────────────────────────
+#   cases: setup(count, rng) -> draw(surface)
+# ──────────────────────────────────────────────────────────
+def enemies_case(kind):
+    def setup(n, rng):
+        ents = [spawn_enemy(kind, rng.randint(1, 4), rng.uniform(0, WIDTH),
+                            rng.uniform(0, HEIGHT), rng=rng) for _ in range(n)]
+        for e in ents:   # half of them damaged so health bars fill partially
+            if rng.random() < 0.5: e.health = e.max_health * rng.random()
+        def draw(surf):
+            for e in ents: e.draw(surf)
+        return draw
+    return setup
+
+def towers_case(n, rng):
+    tws = [PlayerTower(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), max_health=100,
+                       radius=25, shot_cooldown=60, shot_speed=5, shot_damage=4,
+                       shot_range=200) for _ in range(n)]
+    def draw(surf):
+        for t in tws: t.draw(surf)
+    return draw
+
+def projectiles_case(n, rng):
+    store = ProjectileStore()
+    for k in range(n):
+        a = rng.uniform(0, 2*math.pi)
+        store.spawn(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT),
+                    math.cos(a), math.sin(a), is_friendly=k % 2 == 0)
+    store.snapshot()
+    return lambda surf: store.draw(surf, 0.5)
+
+def hud_case(n, rng):
+    build_scenario(0, 0, 0)
+    return lambda surf: GameState._draw_hud()
+
+def upgrade_menu_case(n, rng):
+    build_scenario(0, 0, 0)
+    return lambda surf: GameState.upgrade_menu.draw_menu(surf, GameState.player)
+
+def frame_case(n, rng, dirty=False):
+    # n split like bench_sim: n/5 enemies per type, n/20 towers, 2n projectiles
+    per = max(1, n // len(ENEMY_TYPES))
+    build_scenario(per, max(1, per // 4), 10 * per)
+    GameState.projectiles.snapshot()
+    GameState.dirty_rects = dirty
+    DirtyRects.invalidate()
+    return lambda surf: GameState._draw_game(0.5)
+
+CASES = {f"enemy:{k}": enemies_case(k) for k in ENEMY_TYPES}
+CASES.update({"towers": towers_case, "projectiles": projectiles_case,
+              "hud": hud_case, "upgrade_menu": upgrade_menu_case, "frame": frame_case,
+              "frame:dirty": lambda n, rng: frame_case(n, rng, dirty=True)})
+FIXED = {"hud", "upgrade_menu"}   # cost does not depend on the count
+
+
+# ──────────────────────────────────────────────────────────
+#   measurement
+# ──────────────────────────────────────────────────────────
+def time_case(setup, n, frames, surf):
+    draw = setup(n, random.Random(n))
+    GameState.screen = surf
+    draw(surf)   # warm caches (fonts, glyphs)
+    samples = []
+    for _ in range(frames):
+        surf.fill((30, 30, 30))
+        t0 = time.perf_counter_ns()
+        draw(surf)
+        samples.append(time.perf_counter_ns() - t0)
+    return statistics.median(samples)
+
+def run(counts, cases, frames):
+    pygame.init()
+    surf = pygame.display.set_mode((WIDTH, HEIGHT))
+    report = {"commit": git_commit(), "python": platform.python_version(),
+              "pygame": pygame.version.ver, "machine": platform.machine(),
+              "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "cases": {}}
+    for name in cases:
+        rows = []
+        for n in ([1] if name in FIXED else counts):
+            ns = time_case(CASES[name], n, frames, surf)
+            rows.append({"count": n, "ms": round(ns / 1e6, 4),
+                         "us_per_entity": round(ns / 1e3 / n, 2)})
+        order = fit_order([r["count"] for r in rows], [max(1e-9, r["ms"]) for r in rows])
+        report["cases"][name] = {"sizes": rows, "order": round(order, 3)}
+    pygame.quit()
+    return report
+
+def check_dirty(counts, ticks, surf):
+    """Play the frame scenario in dirty-rect mode; every 5th frame must equal a full repaint."""
+    failed = 0
+    for n in counts:
+        frame_case(n, random.Random(n), dirty=True)
+        GameState.screen = surf
+        bad = 0
+        for t in range(1, ticks + 1):
+            GameState._update_game(IDLE)
+            GameState.dirty_rects = True
+            GameState._draw_game(0.5)
+            if t % 5: continue
+            dirty = pygame.surfarray.array3d(surf)
+            GameState.dirty_rects = False
+            GameState._draw_game(0.5)
+            DirtyRects.invalidate()
+            bad += bool((dirty != pygame.surfarray.array3d(surf)).any())
+        print(f"frame:dirty {n:>6}  {bad}/{ticks // 5} frames differ from a full repaint")
+        failed += bad
+    return failed
+
+def print_report(report):
+    print(f"commit {report['commit'] or '?'}  pygame {report['pygame']}")
+    print(f"{'case':<16} {'count':>6} {'ms/frame':>10} {'us/entity':>10}   order")
+    for name, res in report["cases"].items():
+        for k, r in enumerate(res["sizes"]):
+            per = "" if name in FIXED else f"{r['us_per_entity']:>10.2f}"
+            order = f"   N^{res['order']:.2f}" if k == 0 and name not in FIXED else ""
+            print(f"{name if k == 0 else '':<16} {r['count']:>6} {r['ms']:>10.3f} {per:>10}{order}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Time draw paths under the dummy video driver.")
+    # 3200 stars bring more random colours than enemy.SPRITE_LIMIT
+    ap.add_argument("--counts", type=int, nargs="+", default=[10, 50, 200, 800, 3200])
+    ap.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    ap.add_argument("--frames", type=int, default=20)
+    ap.add_argument("--out", default="bench_render.json")
+    ap.add_argument("--check", action="store_true", help="compare dirty-rect frames with full ones instead")
+    args = ap.parse_args()
+
+    if args.check:
+        pygame.init()
+        surf = pygame.display.set_mode((WIDTH, HEIGHT))
+        raise SystemExit(check_dirty(args.counts, 60, surf) > 0)
+
+    report = run(args.counts, args.cases, args.frames)
+    print_report(report)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"\nwrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Simulation scaling benchmarks.
+
+Builds synthetic scenarios (N enemies of every type from ``spawn_enemy``,
+M PlayerTowers, P projectiles; everything immortal so counts hold still),
+times each simulation stage at several sizes and fits the growth order
+(slope of log time over log entity count). Results go to JSON so runs from
+different commits can be compared.
+
+    python bench_sim.py                       # writes bench_sim.json
+    python bench_sim.py --sizes 10 40 160 --out new.json --compare old.json
+"""
+
+import argparse, json, math, os, platform, random, statistics, subprocess, time
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config     import WIDTH, HEIGHT
+from enemy      import spawn_enemy
+from tower      import PlayerTower
+from waves      import WAVES
+from timeline   import spawn_point
+from headless   import HeadlessGame, IDLE
+
+ENEMY_TYPES = ("triangle", "square", "star", "boss", "fodder")
+IMMORTAL    = 1e12
+
+
+# ──────────────────────────────────────────────────────────
+#   scenario
+# ──────────────────────────────────────────────────────────
+def build_scenario(n_per_type, n_towers, n_projectiles, seed=0):
+    """Fresh GameState holding the requested population; returns GameState."""
+    game = HeadlessGame(1.0, seed=seed)
+    st   = game.state
+    st.wave_index = len(WAVES)   # spawner off
+    rng  = random.Random(seed)
+
+    for p in (st.player, st.central_tower):
+        p.max_health = p.health = IMMORTAL
+    for kind in ENEMY_TYPES:
+        for _ in range(n_per_type):
+            e = spawn_enemy(kind, rng.randint(1, 4),
+                            rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng=rng)
+            e.stats  = e.stats._replace(max_health=IMMORTAL)
+            e.health = IMMORTAL
+            st.enemies.append(e)
+    for _ in range(n_towers):
+        st.towers.append(PlayerTower(rng.uniform(WIDTH*0.2, WIDTH*0.8),
+                                     rng.uniform(HEIGHT*0.2, HEIGHT*0.8),
+                                     max_health=IMMORTAL, radius=25,
+                                     shot_cooldown=60, shot_speed=5,
+                                     shot_damage=4, shot_range=200))
+    for k in range(n_projectiles):
+        a = rng.uniform(0, 2*math.pi)
+        st.projectiles.spawn(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT),
+                             math.cos(a), math.sin(a), speed=2, damage=0.01,
+                             is_friendly=k % 2 == 0)
+    return st
+
+
+# ──────────────────────────────────────────────────────────
+#   stages: each takes a built GameState and runs once
+# ──────────────────────────────────────────────────────────
+def stage_update_game(st):
+    st._update_game(IDLE)
+
+def stage_separation(st):
+    st.enemy_grid.rebuild(st.enemies)
+    for e in st.enemies:
+        e.apply_separation(st.enemies, st.enemy_grid)
+
+def stage_tower_targeting(st):
+    for t in st.towers: t.shot_ready = 0
+    st.central_tower.shot_ready = 0
+    st.targeting.prepare([st.central_tower, *st.towers], st.enemies)
+
+def stage_enemy_targeting(st):
+    st.defender_index.rebuild(st.player, st.towers, st.central_tower)
+    for e in st.enemies:
+        e.find_nearest_target(st.player, st.towers, st.central_tower, st.defender_index)
+        e.find_target_for_projectile(st.player, st.towers, st.central_tower, st.defender_index)
+
+def stage_arrival_scans(st, cull=True):
+    # an endless wave still walking in: every enemy at a spawn point on the
+    # edge, each running the range lookup its attack would make
+    rng = random.Random(len(st.enemies))
+    for e in st.enemies:
+        e.x, e.y = spawn_point(rng)
+    idx = st.defender_index
+    idx.rebuild(st.player, st.towers, st.central_tower)
+    saved, idx.cull = idx.cull, cull and idx.field is not None
+    for e in st.enemies:
+        if e.stats.can_shoot:
+            e.find_target_for_projectile(st.player, st.towers, st.central_tower, idx)
+        else:
+            e.find_target_for_melee(st.player, st.towers, st.central_tower, idx)
+    idx.cull = saved
+
+def stage_arrival_scans_nocull(st):
+    # the same without the out-of-reach cull (CULL_BY_CLEARANCE), for comparison
+    stage_arrival_scans(st, cull=False)
+
+def stage_collision(st):
+    st._handle_projectiles()
+
+STAGES = {
+    "update_game":     stage_update_game,
+    "separation":      stage_separation,
+    "tower_targeting": stage_tower_targeting,
+    "enemy_targeting": stage_enemy_targeting,
+    "arrival_scans":   stage_arrival_scans,
+    "arrival_scans_nocull": stage_arrival_scans_nocull,
+    "collision":       stage_collision,
+}
+
+
+# ──────────────────────────────────────────────────────────
+#   measurement
+# ──────────────────────────────────────────────────────────
+def population(n):
+    """Scenario size for scale ``n``: (enemies per type, towers, projectiles)."""
+    return n, max(1, n // 4), 10 * n
+
+def fit_order(xs, ys):
+    """Least-squares slope of log(y) against log(x)."""
+    lx = [math.log(x) for x in xs]; ly = [math.log(y) for y in ys]
+    mx, my = sum(lx)/len(lx), sum(ly)/len(ly)
+    den = sum((a - mx)**2 for a in lx)
+    return sum((a - mx)*(b - my) for a, b in zip(lx, ly)) / den if den else 0.0
+
+def time_stage(fn, n, repeats):
+    samples = []
+    for r in range(repeats):
+        st = build_scenario(*population(n), seed=r)
+        t0 = time.perf_counter_ns()
+        fn(st)
+        samples.append(time.perf_counter_ns() - t0)
+    return statistics.median(samples)
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+def run(sizes, stages, repeats):
+    report = {"commit": git_commit(), "python": platform.python_version(),
+              "machine": platform.machine(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "stages": {}}
+    for name in stages:
+        rows = []
+        for n in sizes:
+            enemies, towers, projectiles = population(n)
+            entities = enemies * len(ENEMY_TYPES) + towers + projectiles
+            ns = time_stage(STAGES[name], n, repeats)
+            rows.append({"enemies": enemies * len(ENEMY_TYPES), "towers": towers,
+                         "projectiles": projectiles, "entities": entities,
+                         "ms": round(ns / 1e6, 4), "ns_per_entity": round(ns / entities, 1)})
+        order = fit_order([r["entities"] for r in rows], [max(1e-9, r["ms"]) for r in rows])
+        report["stages"][name] = {"sizes": rows, "order": round(order, 3)}
+    return report
+
+def print_report(report, baseline=None):
+    print(f"commit {report['commit'] or '?'}  python {report['python']}")
+    for name, res in report["stages"].items():
+        old = baseline["stages"].get(name, {}) if baseline else {}
+        old = {r["entities"]: r["ms"] for r in old.get("sizes", ())}
+        print(f"\n{name}  (growth order ~ N^{res['order']:.2f})")
+        for r in res["sizes"]:
+            line = f"  {r['entities']:>7} entities  {r['ms']:>9.3f} ms  {r['ns_per_entity']:>9.1f} ns/entity"
+            if r["entities"] in old:
+                line += f"   x{r['ms'] / max(1e-9, old[r['entities']]):.2f} vs {baseline['commit']}"
+            print(line)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Time simulation stages at increasing sizes.")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 40, 80, 160],
+                    help="enemies per type; towers = n/4, projectiles = 10n")
+    ap.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES))
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--out", default="bench_sim.json")
+    ap.add_argument("--compare", help="earlier result file to compare against")
+    args = ap.parse_args()
+
+    report = run(args.sizes, args.stages, args.repeats)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"\nwrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
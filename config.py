@@ -12,6 +12,21 @@ HUD_FONT_SIZE = 36
 INSTRUCTIONS_FONT_SIZE = 28
 INSTRUCTIONS_OVERLAY_SIZE = (800, 400)
 INSTRUCTIONS_OVERLAY_ALPHA = 180
+TEXT_CACHE_BYTES = 4 << 20   # rendered labels kept for reuse, see text.py (None = render every frame)
+
+# Simulation
+TICK_RATE           = 60   # fixed simulation ticks per second
+MAX_TICKS_PER_FRAME = 5    # catch-up cap per rendered frame (avoids spiral of death)
+BATCH_KINEMATICS_MIN_ENEMIES = 64   # batched enemy movement from this many enemies (None = off)
+FLOW_FIELD_CELL     = 20   # nearest-defender navigation grid, px per cell (None = exact search)
+CULL_BY_CLEARANCE   = True # skip range scans the flow field shows cannot reach a defender (exact, speed only)
+PERF_WINDOW         = 120  # frames in the F3 timing overlay's rolling window
+DIRTY_RECTS         = False  # redraw and push only the parts of the screen that changed (see dirty.py)
+DIRTY_RECT_LIMIT    = 0.4    # ...with a full flip instead once they cover this share of the screen
+
+# Replays (see replay.py)
+RECORD_REPLAYS = False      # record every game's inputs for bit-exact playback
+REPLAY_DIR     = "replays"
 
 # Player
 PLAYER_START_MONEY = 50
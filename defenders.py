@@ -0,0 +1,105 @@
+import math
+
+class DefenderIndex:
+    """
+    Per-tick snapshot of everything enemies can target: the player, the placed
+    towers and the central tower, kept in the scan order the old per-enemy
+    lookups used (player, towers..., central).
+
+    Range-limited lookups (shooting, melee) only scan defenders bucketed near
+    the enemy, and with ``cull`` they skip even that when the ``FlowField``
+    shows every defender is out of range, which is most of the crowd still
+    walking in from the edges. The unbounded nearest-defender lookup reads
+    the ``FlowField`` when there is one; otherwise it is cached per enemy and
+    reused while neither the enemy nor the player has moved far enough to
+    close the gap to the runner-up, or until a defender is placed or lost.
+    """
+    SLACK = 1e-6
+
+    def __init__(self, cell_size=128, field=None, cull=True):
+        self.cell_size = cell_size
+        self.field     = field
+        self.cull      = cull and field is not None
+        self.defenders = []
+        self.cells     = {}   # (cx, cy) -> [scan index, ...]
+        self.player    = None
+        self.version   = 0
+        self._members  = ()
+
+    def rebuild(self, player, towers, central_tower):
+        self.player    = player
+        self.defenders = [player, *towers, central_tower]
+        members = tuple(id(d) for d in self.defenders if d.health > 0)
+        if members != self._members:
+            self._members = members
+            self.version += 1
+        self.cells.clear()
+        cs = self.cell_size
+        for i, d in enumerate(self.defenders):
+            key = (math.floor(d.x / cs), math.floor(d.y / cs))
+            self.cells.setdefault(key, []).append(i)
+        if self.field is not None:
+            self.field.update(self.defenders)
+
+    # ------------------------------------------------------------------
+    def nearest(self, e):
+        """Position of the nearest living defender, as find_nearest_target."""
+        d = self.nearest_defender(e)
+        return (None, None) if d is None else (d.x, d.y)
+
+    def nearest_defender(self, e):
+        """The defender ``nearest`` goes for, or None."""
+        if self.field is not None:
+            k = self.field.owner_at(e.x, e.y)
+            if k >= 0:
+                d = self.defenders[k]
+                if d.health > 0:
+                    return d
+            # lost since the field was built: exact search below
+        pl = self.player
+        c  = e.target_cache
+        if c is not None and c[0] == self.version:
+            _, d, ex, ey, px, py, margin = c
+            if d.health > 0:
+                drift = math.hypot(e.x - ex, e.y - ey) + math.hypot(pl.x - px, pl.y - py)
+                if 2*drift + self.SLACK < margin:
+                    return d
+
+        best, nd, second = None, float('inf'), float('inf')
+        for d in self.defenders:
+            if d.health <= 0: continue
+            dist = math.hypot(d.x - e.x, d.y - e.y)
+            if dist < nd:
+                second, nd, best = nd, dist, d
+            elif dist < second:
+                second = dist
+        if best is None:
+            e.target_cache = None
+            return None
+        e.target_cache = (self.version, best, e.x, e.y, pl.x, pl.y, second - nd)
+        return best
+
+    def in_range(self, e, rng):
+        """Nearest living defender closer than ``rng``, as (target, distance)."""
+        if self.cull and self.field.clearance(e.x, e.y) >= rng:
+            return (None, None)
+        cs = self.cell_size
+        x0, x1 = math.floor((e.x - rng) / cs), math.floor((e.x + rng) / cs)
+        y0, y1 = math.floor((e.y - rng) / cs), math.floor((e.y + rng) / cs)
+        cells, near = self.cells, []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket: near.extend(bucket)
+        near.sort()
+        best, bd = None, float('inf')
+        defs = self.defenders
+        for i in near:
+            d = defs[i]
+            if d.health > 0:
+                dist = math.hypot(d.x - e.x, d.y - e.y)
+                if dist < rng and dist < bd:
+                    best, bd = d, dist
+        if best is None:
+            return (None, None)
+        return (best, bd)
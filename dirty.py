@@ -0,0 +1,58 @@
+import pygame
+
+from config import DIRTY_RECT_LIMIT
+
+
+class DirtyRects:
+    """
+    Partial screen updates for the game view. Draw calls hand back the rects
+    they touched; ``begin`` erases last frame's rects by copying the
+    background over them, the whole scene is drawn again on top, and ``end``
+    pushes only the old and new rects with ``pygame.display.update``.
+
+    The background is the floor plus every tower's range circle, repainted
+    when ``key`` changes (a tower placed, lost or upgraded). Once the rects
+    cover more than ``DIRTY_RECT_LIMIT`` of the screen, or after anything
+    else drew on it (``invalidate``), frames are full repaints and flips.
+    """
+    background = None
+    _key       = None
+    _last      = None   # rects drawn last frame; None = repaint everything
+
+    @classmethod
+    def invalidate(cls):
+        cls._last = None
+
+    @classmethod
+    def begin(cls, screen, key, paint):
+        """Erase last frame; ``paint(surface)`` draws the background when ``key`` changes."""
+        if cls.background is None or cls.background.get_size() != screen.get_size():
+            cls.background = pygame.Surface(screen.get_size()).convert(screen)
+            cls._key = None
+        if key != cls._key:
+            cls._key = key
+            paint(cls.background)
+            cls._last = None
+        bg = cls.background
+        if cls._last is None:
+            screen.blit(bg, (0, 0))
+        else:
+            for r in cls._last:
+                screen.blit(bg, r, r)
+
+    @staticmethod
+    def _over(screen, rects):
+        # overlaps count twice, which only errs towards a full repaint
+        return sum(r.w * r.h for r in rects) > DIRTY_RECT_LIMIT * screen.get_width() * screen.get_height()
+
+    @classmethod
+    def end(cls, screen, rects):
+        """Show the frame: last and current rects, or a full flip."""
+        rects = [r for r in rects if r]
+        last = cls._last
+        # a frame this busy is cheaper to erase in one go next time as well
+        cls._last = None if cls._over(screen, rects) else rects
+        if last is None or cls._last is None or cls._over(screen, last + rects):
+            pygame.display.flip()
+        else:
+            pygame.display.update(last + rects)
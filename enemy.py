@@ -1,53 +1,186 @@
 import pygame
 import math
 import random
-from projectile import Projectile
+from collections import namedtuple, OrderedDict
+from operator import attrgetter
 from utils import draw_health_bar
 from music_manager import MusicManager
+from timers import Clock
+
+# ------------------------------------------------------------------------
+# Stat blocks: everything fixed by (type, tier, difficulty) lives in one shared,
+# immutable EnemyStats; enemies hold a reference to it plus their mutable state.
+EnemyStats = namedtuple("EnemyStats", (
+    "tier", "speed", "max_health", "damage", "melee_damage", "kill_reward",
+    "shot_cooldown", "shot_speed", "shot_range", "size", "can_shoot",
+    "melee_range", "melee_cooldown", "hit_flash_duration", "special_cooldown",
+    # per-type extras
+    "charge_cooldown", "charge_duration", "armor", "aim_pause_cooldown",
+    "dash_duration", "dash_speed_multiplier", "dash_cooldown", "invis_duration"),
+    defaults=(5, 180, None, None, None, None, None, None, None, None))
+
+_stat_table = {}   # (class, tier, difficulty) -> EnemyStats
+
+def _scaled(difficulty, health, damage, melee_damage, **stats):
+    # health and damage scale with difficulty
+    return EnemyStats(max_health=health * difficulty, damage=damage * difficulty,
+                      melee_damage=melee_damage * difficulty, **stats)
+
+def stat_block(cls, tier, difficulty):
+    """The shared stat block for ``cls`` at ``tier`` and ``difficulty``."""
+    key = (cls, tier, difficulty)
+    st = _stat_table.get(key)
+    if st is None:
+        st = _stat_table[key] = cls.make_stats(tier, difficulty)
+    return st
+
+def build_stat_table(difficulty, tiers=(1, 2, 3, 4)):
+    """Precompute every enemy type's blocks for ``difficulty`` (run when it is chosen)."""
+    _stat_table.clear()
+    for cls in (TriangleEnemy, SquareEnemy, StarEnemy, BossEnemy, FodderEnemy):
+        for tier in tiers:
+            stat_block(cls, tier, difficulty)
+
+# ------------------------------------------------------------------------
+# Sprites: each look an enemy can have is rasterised once by its class's
+# ``render_sprite`` and blitted from then on, the least recently used going
+# once there are ``SPRITE_LIMIT``. Colours an enemy picks at random (stars)
+# would give every enemy its own look, so opaque ones share one 8-bit mask
+# per size and are painted in through its palette (``tint_sprite``).
+_sprites     = OrderedDict()   # (class, size, colour or None, alpha) -> (surface, pad)
+SPRITE_LIMIT = 1024
+
+def _cached(key):
+    sp = _sprites.get(key)
+    if sp is not None:
+        _sprites.move_to_end(key)
+    return sp
+
+def _store(key, sp):
+    _sprites[key] = sp
+    if len(_sprites) > SPRITE_LIMIT:
+        _sprites.popitem(last=False)
+    return sp
+
+def enemy_sprite(cls, size, color, alpha=255):
+    """``(surface, pad)`` for that look; blit it at the enemy's (x, y) minus ``pad``."""
+    key = (cls, size, color, alpha)
+    sp = _cached(key)
+    if sp is None:
+        surf, pad = cls.render_sprite(size, color, alpha)
+        if pygame.display.get_surface() is None:
+            pass   # no display format to convert to yet
+        elif alpha == 255:
+            # opaque: shapes are never black, so an RLE colour key on the
+            # transparent background blits far faster than per-pixel alpha
+            surf = surf.convert()
+            surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        else:
+            surf = surf.convert_alpha()
+        sp = _store(key, (surf, pad))
+    return sp
+
+def tint_sprite(cls, size, color):
+    """Opaque ``enemy_sprite``, as the shared mask recoloured; blit it before asking for another."""
+    key = (cls, size, None, 255)
+    sp = _cached(key)
+    if sp is None:
+        shape, pad = cls.render_sprite(size, (255, 255, 255), 255)
+        surf = pygame.Surface(shape.get_size(), depth=8)
+        surf.set_palette_at(0, (0, 0, 0))
+        surf.set_palette_at(1, (255, 255, 255))
+        surf.fill(0)
+        surf.blit(shape, (0, 0))   # shape pixels land on index 1, the rest stays 0
+        surf.set_colorkey(0)
+        sp = _store(key, (surf, pad))
+    sp[0].set_palette_at(1, color)
+    return sp
+
+def _star_points(size):
+    points = []
+    num_pts = 5
+    outer_r = size//2
+    inner_r = outer_r*0.5
+    angle_offset = -math.pi/2
+    for i in range(num_pts*2):
+        r = outer_r if i%2==0 else inner_r
+        angle = (math.pi*i/num_pts)+angle_offset
+        points.append((size//2 + r*math.cos(angle), size//2 + r*math.sin(angle)))
+    return points
+
 
 class BaseEnemy:
-    def __init__(self, x, y, speed, health, damage, kill_reward,
-                 shot_cooldown, shot_speed, shot_range,
-                 size, can_shoot=True, melee_range=25, melee_damage=4, melee_cooldown=60):
+    __slots__ = ("stats", "x", "y", "prev_x", "prev_y", "speed", "shot_cooldown",
+                 "health", "shot_ready", "melee_ready", "hit_until", "special_ready",
+                 "timer_event", "target_cache", "color")
+    # subclasses add only their own behaviour state; the EnemyStats fields
+    # are readable as attributes too (properties below the classes)
+
+    def __init__(self, x, y, stats):
+        self.stats = stats
         self.x = x
         self.y = y
-        self.speed = speed
-        self.kill_reward = kill_reward
-        self.shot_cooldown = shot_cooldown
-        self.shot_timer = 0
-        self.shot_speed = shot_speed
-        self.shot_range = shot_range
-        self.size = size
-        self.can_shoot = can_shoot
-        self.melee_range = melee_range
-        self.melee_cooldown = melee_cooldown
-        self.melee_timer = 0
-
-        # Scale health and damage by difficulty
-        diff = getattr(pygame, "difficulty", 1.0)
-        self.max_health = health * diff
-        self.health = self.max_health
-        self.damage = damage * diff
-        self.melee_damage = melee_damage * diff
-
-        # For a hit flash
-        self.is_hit = False
-        self.hit_flash_duration = 5
-        self.hit_timer = 0
+        self.prev_x = x  # position last tick, for render interpolation
+        self.prev_y = y
+        # current values; specials change them and put them back
+        self.speed = stats.speed
+        self.shot_cooldown = stats.shot_cooldown
+        self.health = stats.max_health
+        self.shot_ready = 0   # Clock tick the next shot is allowed on
+        self.melee_ready = 0
+        self.hit_until = 0    # hit flash
 
         # Extra optional fields for new behaviors
-        self.special_timer = 0  # can be used for special movement
-        self.special_cooldown = 180  # frames between special actions
+        self.special_ready = 0  # tick the next special action may start
+        self.timer_event = None  # pending Clock.wheel event, see release_enemy
 
-    def update(self, player, towers, central_tower, projectiles, all_enemies):
+        # last nearest-defender answer, see DefenderIndex.nearest
+        self.target_cache = None
+
+    def update(self, player, towers, central_tower, projectiles, all_enemies, grid=None, step=None,
+               defenders=None):
         if self.health <= 0:
             return
 
-        # Possibly do a special action
-        self.update_special_behavior()
+        if step is None:
+            # Possibly do a special action
+            self.update_special_behavior()
+            self.move_toward_nearest(player, towers, central_tower, defenders)
+        else:
+            # batched stage already ran the special action and the move maths
+            sx, sy, tgt = step
+            if tgt is None or tgt.health > 0:
+                self.x += sx
+                self.y += sy
+            else:
+                # chosen defender died earlier this tick, re-pick like the scalar path
+                self.move_toward_nearest(player, towers, central_tower, defenders)
+
+        self.apply_separation(all_enemies, grid)
+
+        # Attack logic
+        if self.stats.can_shoot:
+            self.handle_ranged_attack(player, towers, central_tower, projectiles, defenders)
+        else:
+            self.handle_melee_attack(player, towers, central_tower, defenders)
+
+    @property
+    def is_hit(self):
+        return Clock.now < self.hit_until
+
+    @staticmethod
+    def render_sprite(size, color, alpha):
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        surf.fill((*color, alpha))
+        return surf, 0
 
+    def blit_sprite(self, surface, color, alpha=255):
+        sprite, pad = enemy_sprite(type(self), self.stats.size, color, alpha)
+        return surface.blit(sprite, (self.x - pad, self.y - pad))
+
+    def move_toward_nearest(self, player, towers, central_tower, defenders=None):
         # Normal movement
-        tx, ty = self.find_nearest_target(player, towers, central_tower)
+        tx, ty = self.find_nearest_target(player, towers, central_tower, defenders)
         if tx is not None and ty is not None:
             dx, dy = tx - self.x, ty - self.y
             dist = math.hypot(dx, dy)
@@ -55,20 +188,6 @@ class BaseEnemy:
                 self.x += (dx/dist)*self.speed
                 self.y += (dy/dist)*self.speed
 
-        self.apply_separation(all_enemies)
-
-        # Attack logic
-        if self.can_shoot:
-            self.handle_ranged_attack(player, towers, central_tower, projectiles)
-        else:
-            self.handle_melee_attack(player, towers, central_tower)
-
-        # Hit flash
-        if self.is_hit:
-            self.hit_timer -= 1
-            if self.hit_timer <= 0:
-                self.is_hit = False
-
     def update_special_behavior(self):
         """
         Override in subclasses for specialized movement or actions.
@@ -76,18 +195,16 @@ class BaseEnemy:
         """
         pass
 
-    def handle_ranged_attack(self, player, towers, central_tower, projectiles):
-        if self.shot_timer > 0:
-            self.shot_timer -= 1
-        else:
-            target, distance = self.find_target_for_projectile(player, towers, central_tower)
+    def handle_ranged_attack(self, player, towers, central_tower, projectiles, defenders=None):
+        if Clock.now >= self.shot_ready:
+            target, distance = self.find_target_for_projectile(player, towers, central_tower, defenders)
             if target is not None:
                 dx, dy = (target.x - self.x), (target.y - self.y)
                 dist = math.hypot(dx, dy)
                 if dist > 0:
                     dirx = dx/dist
                     diry = dy/dist
-                    proj = Projectile(
+                    projectiles.spawn(
                         x=self.x,
                         y=self.y,
                         dx=dirx,
@@ -96,20 +213,20 @@ class BaseEnemy:
                         damage=self.damage,
                         is_friendly=False
                     )
-                    projectiles.append(proj)
                     MusicManager.play_sfx("laser.ogg")
-                self.shot_timer = self.shot_cooldown
+                # cooldown ticks pass before the next try, as the old countdown
+                self.shot_ready = Clock.now + self.shot_cooldown + 1
 
-    def handle_melee_attack(self, player, towers, central_tower):
-        if self.melee_timer > 0:
-            self.melee_timer -= 1
-        else:
-            target, distance = self.find_target_for_melee(player, towers, central_tower)
+    def handle_melee_attack(self, player, towers, central_tower, defenders=None):
+        if Clock.now >= self.melee_ready:
+            target, distance = self.find_target_for_melee(player, towers, central_tower, defenders)
             if target is not None and distance < self.melee_range:
                 target.take_damage(self.melee_damage)
-                self.melee_timer = self.melee_cooldown
+                self.melee_ready = Clock.now + self.melee_cooldown + 1
 
-    def find_nearest_target(self, player, towers, central_tower):
+    def find_nearest_target(self, player, towers, central_tower, defenders=None):
+        if defenders is not None:
+            return defenders.nearest(self)
         possible = []
         if player.health > 0:
             possible.append((player.x, player.y))
@@ -131,7 +248,9 @@ class BaseEnemy:
                 nearest = (tx, ty)
         return nearest if nearest else (None, None)
 
-    def find_target_for_projectile(self, player, towers, central_tower):
+    def find_target_for_projectile(self, player, towers, central_tower, defenders=None):
+        if defenders is not None:
+            return defenders.in_range(self, self.shot_range)
         best = None
         bd = float('inf')
         # Check player
@@ -158,7 +277,9 @@ class BaseEnemy:
         else:
             return (best, bd)
 
-    def find_target_for_melee(self, player, towers, central_tower):
+    def find_target_for_melee(self, player, towers, central_tower, defenders=None):
+        if defenders is not None:
+            return defenders.in_range(self, self.melee_range)
         best = None
         bd = float('inf')
         if player.health > 0:
@@ -181,60 +302,88 @@ class BaseEnemy:
         else:
             return (best, bd)
 
-    def apply_separation(self, all_enemies):
+    def apply_separation(self, all_enemies, grid=None):
         sep_force = 0.5
-        for oth in all_enemies:
+        if grid is not None:
+            # only look at cells that can hold an overlapping neighbour
+            grid.move(self)
+            others = grid.neighbours(self, (self.stats.size + grid.max_size) / 2)
+        else:
+            others = all_enemies
+        size = self.stats.size
+        for oth in others:
             if oth is self or oth.health <= 0:
                 continue
             dx = self.x - oth.x
             dy = self.y - oth.y
             dist = math.hypot(dx, dy)
-            min_d = (self.size + oth.size) / 2
+            min_d = (size + oth.stats.size) / 2
             if dist < min_d and dist > 0:
                 push = (min_d - dist) * sep_force
                 self.x += (dx/dist)*push
                 self.y += (dy/dist)*push
+        if grid is not None:
+            grid.move(self)
 
     def take_damage(self, amt):
         self.health -= amt
         if self.health < 0:
             self.health = 0
-        self.is_hit = True
-        self.hit_timer = self.hit_flash_duration
+        self.hit_until = Clock.now + self.stats.hit_flash_duration
 
     def center(self):
         # Returns the center (cx, cy) of the enemy for collision
         return (self.x + self.size / 2, self.y + self.size / 2)
 
     def draw(self, surface):
-        color = (255,255,255) if self.is_hit else (200, 50, 50)
-        pygame.draw.rect(surface, color, (self.x, self.y, self.size, self.size))
+        body = self.blit_sprite(surface, (255,255,255) if self.is_hit else (200, 50, 50))
         # Health bar
         bar_width = self.size
         bar_height = 6
         bar_x = int(self.x)
         bar_y = int(self.y - 12)
-        draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1))
 
 # ------------------------------------------------------------------------
 # Specialized enemies with advanced or distinct behavior below
 
-def spawn_enemy(shape_type, tier, x, y):
+# Dead enemies are handed back with release_enemy and spawn_enemy re-runs
+# __init__ on them, so a steady stream of waves stops allocating enemies.
+_free_enemies = {}   # class -> [dead instance, ...]
+
+def release_enemy(e):
+    if e.timer_event is not None:
+        Clock.wheel.cancel(e.timer_event)
+        e.timer_event = None
+    _free_enemies.setdefault(type(e), []).append(e)
+
+def _make(cls, x, y, tier, difficulty, rng):
+    free = _free_enemies.get(cls)
+    if free:
+        e = free.pop()
+        e.__init__(x, y, tier, difficulty, rng)
+        return e
+    return cls(x, y, tier, difficulty, rng)
+
+def spawn_enemy(shape_type, tier, x, y, difficulty=1.0, rng=random):
     if shape_type == "triangle":
-        return TriangleEnemy(x, y, tier)
+        return _make(TriangleEnemy, x, y, tier, difficulty, rng)
     elif shape_type == "square":
-        return SquareEnemy(x, y, tier)
+        return _make(SquareEnemy, x, y, tier, difficulty, rng)
     elif shape_type == "star":
-        return StarEnemy(x, y, tier)
+        return _make(StarEnemy, x, y, tier, difficulty, rng)
     elif shape_type == "boss":
-        return BossEnemy(x, y, tier)
+        return _make(BossEnemy, x, y, tier, difficulty, rng)
     elif shape_type == "fodder":
-        return FodderEnemy(x, y, tier)
+        return _make(FodderEnemy, x, y, tier, difficulty, rng)
     else:
-        return SquareEnemy(x, y, tier=1)
+        return _make(SquareEnemy, x, y, 1, difficulty, rng)
 
 class TriangleEnemy(BaseEnemy):
-    def __init__(self, x, y, tier=1):
+    __slots__ = ("charging",)
+
+    @staticmethod
+    def make_stats(tier, difficulty):
         # Tier-based stats
         # Nerf late game: reduce scaling for tier 3/4
         if tier >= 3:
@@ -252,8 +401,9 @@ class TriangleEnemy(BaseEnemy):
         # Make size scale more strongly with tier
         size = 28 + 8*(tier-1)
         # Melee range = 35 + 5*(tier-1)
-        super().__init__(
-            x, y,
+        return _scaled(
+            difficulty,
+            tier=tier,
             speed=speed,
             health=health,
             damage=damage,
@@ -265,52 +415,51 @@ class TriangleEnemy(BaseEnemy):
             can_shoot=False,
             melee_range=35+5*(tier-1),
             melee_damage=damage,
-            melee_cooldown=45
+            melee_cooldown=45,
+            # Specialized charge behavior
+            charge_cooldown=300 - 20*(tier-1),  # frames between charges
+            charge_duration=30,
         )
-        self.color = (random.randint(180,255), random.randint(50,150), random.randint(50,150))
-        self.tier = tier
-        # Specialized charge behavior
-        self.charge_cooldown = 300 - 20*(tier-1)  # frames between charges
-        self.charge_timer = 0
+
+    def __init__(self, x, y, tier=1, difficulty=1.0, rng=random):
+        super().__init__(x, y, stat_block(TriangleEnemy, tier, difficulty))
+        self.color = (rng.randint(180,255), rng.randint(50,150), rng.randint(50,150))
         self.charging = False
-        self.charge_duration = 30
 
     def update_special_behavior(self):
         # Triangle occasionally "charges" in a straight line
-        if self.charging:
-            # Already in a charge
-            self.charge_timer -= 1
-            if self.charge_timer <= 0:
-                self.charging = False
-                self.speed /= 2  # revert speed
-        else:
-            # not charging
-            if self.special_timer>0:
-                self.special_timer-=1
-            else:
-                # begin a charge
-                self.charging = True
-                self.speed *= 2  # double speed
-                self.charge_timer = self.charge_duration
-                self.special_timer = self.charge_cooldown
+        if not self.charging and Clock.now >= self.special_ready:
+            # begin a charge; the cooldown runs once it is over
+            self.charging = True
+            self.speed *= 2  # double speed
+            self.timer_event = Clock.after(self.charge_duration, self._end_charge)
+            self.special_ready = Clock.now + self.charge_duration + self.charge_cooldown + 1
+
+    def _end_charge(self):
+        self.timer_event = None
+        self.charging = False
+        self.speed /= 2  # revert speed
+
+    @staticmethod
+    def render_sprite(size, color, alpha):
+        surf = pygame.Surface((size + 1, size + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, (*color, alpha), [(size/2, 0), (0, size), (size, size)])
+        return surf, 0
 
     def draw(self, surface):
-        color = (255, 200, 80) if not self.is_hit else (255,255,255)
-        points = [
-            (self.x + self.size/2, self.y),
-            (self.x, self.y + self.size),
-            (self.x + self.size, self.y + self.size)
-        ]
-        pygame.draw.polygon(surface, color, points)
+        body = self.blit_sprite(surface, (255, 200, 80) if not self.is_hit else (255,255,255))
         # Health bar
         bar_width = self.size
         bar_height = 6
         bar_x = int(self.x)
         bar_y = int(self.y - 12)
-        draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1))
 
 class SquareEnemy(BaseEnemy):
-    def __init__(self, x, y, tier=1):
+    __slots__ = ("aim_pause_until",)
+
+    @staticmethod
+    def make_stats(tier, difficulty):
         # Nerf late game: reduce scaling for tier 3/4
         if tier >= 3:
             health = 30 + 15*(tier-1) - 10*(tier-2)
@@ -326,8 +475,9 @@ class SquareEnemy(BaseEnemy):
         shot_range = 220 + 20*(tier-1)
         # Make size scale more strongly with tier
         size = 32 + 10*(tier-1)
-        super().__init__(
-            x, y,
+        return _scaled(
+            difficulty,
+            tier=tier,
             speed=speed,
             health=health,
             damage=damage,
@@ -339,49 +489,49 @@ class SquareEnemy(BaseEnemy):
             can_shoot=True,
             melee_range=25,
             melee_damage=damage,
-            melee_cooldown=80
+            melee_cooldown=80,
+            # slight armor that reduces incoming damage
+            armor=1 + (tier - 1),
+            # sometimes squares pause to aim
+            aim_pause_cooldown=200,
         )
-        self.color = (random.randint(50,150), random.randint(180,255), random.randint(50,150))
-        self.tier = tier
 
-        # slight armor that reduces incoming damage
-        self.armor = 1 + (tier - 1)
-
-        # sometimes squares pause to aim
-        self.aim_pause_timer = 0
-        self.aim_pause_cooldown = 200
+    def __init__(self, x, y, tier=1, difficulty=1.0, rng=random):
+        super().__init__(x, y, stat_block(SquareEnemy, tier, difficulty))
+        self.color = (rng.randint(50,150), rng.randint(180,255), rng.randint(50,150))
+        self.aim_pause_until = 0   # last tick of the current pause
 
     def take_damage(self, amt):
         # reduce damage by armor
-        amt = max(0, amt - self.armor)
+        amt = max(0, amt - self.stats.armor)
         super().take_damage(amt)
 
     def update_special_behavior(self):
         # occasionally squares freeze in place for better aim
-        if self.aim_pause_timer>0:
-            self.aim_pause_timer-=1
+        now = Clock.now
+        if now <= self.aim_pause_until:
             self.speed=0
         else:
-            self.speed=1.5 + 0.2*(self.tier-1)
-            if self.special_timer>0:
-                self.special_timer-=1
-            else:
-                # do a pause
-                self.aim_pause_timer=60
-                self.special_timer=self.aim_pause_cooldown
+            self.speed=1.5 + 0.2*(self.stats.tier-1)
+            if now >= self.special_ready:
+                # do a pause, starting next tick
+                self.aim_pause_until = now + 60
+                self.special_ready = now + 60 + self.stats.aim_pause_cooldown + 1
 
     def draw(self, surface):
-        color = (80, 200, 255) if not self.is_hit else (255,255,255)
-        pygame.draw.rect(surface, color, (self.x, self.y, self.size, self.size))
+        body = self.blit_sprite(surface, (80, 200, 255) if not self.is_hit else (255,255,255))
         # Health bar
         bar_width = self.size
         bar_height = 6
         bar_x = int(self.x)
         bar_y = int(self.y - 12)
-        draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1))
 
 class StarEnemy(BaseEnemy):
-    def __init__(self, x, y, tier=1):
+    __slots__ = ("dashing", "invis_until")
+
+    @staticmethod
+    def make_stats(tier, difficulty):
         # Nerf late game: reduce scaling for tier 3/4
         if tier >= 3:
             health = 18 + 8*(tier-1) - 5*(tier-2)
@@ -397,8 +547,9 @@ class StarEnemy(BaseEnemy):
         shot_range = 260 + 20*(tier-1)
         # Make size scale more strongly with tier
         size = 28 + 9*(tier-1)
-        super().__init__(
-            x, y,
+        return _scaled(
+            difficulty,
+            tier=tier,
             speed=speed,
             health=health,
             damage=damage,
@@ -410,20 +561,25 @@ class StarEnemy(BaseEnemy):
             can_shoot=True,
             melee_range=30,
             melee_damage=damage,
-            melee_cooldown=70
+            melee_cooldown=70,
+            # short dash effect
+            dash_duration=20,
+            dash_speed_multiplier=3,
+            dash_cooldown=240,
+            # small invisibility frames
+            invis_duration=40,
         )
-        self.color = (random.randint(50,150), random.randint(50,150), random.randint(180,255))
-        self.tier = tier
 
-        # short dash effect
-        self.dash_timer = 0
-        self.dash_duration = 20
-        self.dash_speed_multiplier = 3
-        self.dash_cooldown = 240
+    def __init__(self, x, y, tier=1, difficulty=1.0, rng=random):
+        super().__init__(x, y, stat_block(StarEnemy, tier, difficulty))
+        self.color = (rng.randint(50,150), rng.randint(50,150), rng.randint(180,255))
+        self.dashing = False
+        self.invis_until = 0
 
-        # small invisibility frames
-        self.invis_timer = 0
-        self.invis_duration = 40
+    @property
+    def invis_timer(self):
+        # invisibility ticks left, as the old per-tick countdown showed them
+        return max(0, self.invis_until - Clock.now)
 
     def take_damage(self, amt):
         # If invis_timer > 0, we ignore damage
@@ -432,81 +588,51 @@ class StarEnemy(BaseEnemy):
         super().take_damage(amt)
 
     def update_special_behavior(self):
-        if self.dash_timer>0:
-            self.dash_timer-=1
-            if self.dash_timer<=0:
-                self.speed /= self.dash_speed_multiplier
-                # after dash, become invisible for a short time
-                self.invis_timer=self.invis_duration
-        else:
-            if self.special_timer>0:
-                self.special_timer-=1
-            else:
-                # do a dash
-                self.dash_timer=self.dash_duration
-                self.special_timer=self.dash_cooldown
-                self.speed*= self.dash_speed_multiplier
-
-        if self.invis_timer>0:
-            self.invis_timer-=1
+        if not self.dashing and Clock.now >= self.special_ready:
+            # do a dash; the cooldown runs once it is over
+            self.dashing = True
+            self.speed*= self.dash_speed_multiplier
+            self.timer_event = Clock.after(self.dash_duration, self._end_dash)
+            self.special_ready = Clock.now + self.dash_duration + self.dash_cooldown + 1
+
+    def _end_dash(self):
+        self.timer_event = None
+        self.dashing = False
+        self.speed /= self.dash_speed_multiplier
+        # after dash, become invisible for a short time
+        self.invis_until = Clock.now + self.invis_duration - 1
+
+    @staticmethod
+    def render_sprite(size, color, alpha):
+        surf = pygame.Surface((size + 1, size + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, (*color, alpha), _star_points(size))
+        return surf, 0
 
     def draw(self, surface):
-        # if invis_timer>0, we can either reduce alpha or skip drawing
+        # while invisible, draw partially transparent
         if self.invis_timer>0:
-            # draw partially transparent
-            alpha_surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
             if self.is_hit:
-                c = (255,255,255,self.invis_timer*3)  # flicker
+                body = self.blit_sprite(surface, (255,255,255), self.invis_timer*3)  # flicker
             else:
-                c = (*self.color, 60)  # faint
-            cx = self.x + self.size//2
-            cy = self.y + self.size//2
-            # star shape
-            points = []
-            num_pts=5
-            outer_r=self.size//2
-            inner_r=outer_r*0.5
-            angle_offset=-math.pi/2
-            for i in range(num_pts*2):
-                r = outer_r if i%2==0 else inner_r
-                angle = (math.pi*i/num_pts)+angle_offset
-                px = (self.size//2) + r*math.cos(angle)
-                py = (self.size//2) + r*math.sin(angle)
-                points.append((px,py))
-            pygame.draw.polygon(alpha_surf, c, points)
-            surface.blit(alpha_surf, (self.x, self.y))
-            # Health bar
-            bar_width = self.size
-            bar_height = 6
-            bar_x = int(self.x)
-            bar_y = int(self.y - 12)
-            draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1)
+                body = self.blit_sprite(surface, self.color, 60)  # faint
+        elif self.is_hit:
+            body = self.blit_sprite(surface, (255,255,255))
         else:
-            # normal
-            color = (255,255,255) if self.is_hit else self.color
-            cx = self.x + self.size//2
-            cy = self.y + self.size//2
-            points = []
-            num_pts = 5
-            outer_r = self.size//2
-            inner_r = outer_r*0.5
-            angle_offset = -math.pi/2
-            for i in range(num_pts*2):
-                r = outer_r if i%2==0 else inner_r
-                angle = (math.pi*i/num_pts)+angle_offset
-                px = cx + r*math.cos(angle)
-                py = cy + r*math.sin(angle)
-                points.append((px,py))
-            pygame.draw.polygon(surface, color, points)
-            # Health bar
-            bar_width = self.size
-            bar_height = 6
-            bar_x = int(self.x)
-            bar_y = int(self.y - 12)
-            draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1)
+            # own random colour: tinted, one cached look per star would churn the cache
+            sprite, pad = tint_sprite(StarEnemy, self.stats.size, self.color)
+            body = surface.blit(sprite, (self.x - pad, self.y - pad))
+        # Health bar
+        bar_width = self.size
+        bar_height = 6
+        bar_x = int(self.x)
+        bar_y = int(self.y - 12)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(220,80,80), border_width=1))
 
 class BossEnemy(BaseEnemy):
-    def __init__(self, x, y, tier=1):
+    __slots__ = ("phase",)
+
+    @staticmethod
+    def make_stats(tier, difficulty):
         # Boss stats: much larger, much more health, much slower
         # Nerf late game: reduce scaling for tier 3/4
         if tier >= 3:
@@ -522,8 +648,9 @@ class BossEnemy(BaseEnemy):
         shot_speed = 7 + 1*(tier-1)
         shot_range = 350 + 30*(tier-1)
         size = 80 + 10*(tier-1)
-        super().__init__(
-            x, y,
+        return _scaled(
+            difficulty,
+            tier=tier,
             speed=speed,
             health=health,
             damage=damage,
@@ -535,66 +662,73 @@ class BossEnemy(BaseEnemy):
             can_shoot=True,
             melee_range=55,
             melee_damage=damage,
-            melee_cooldown=30
+            melee_cooldown=30,
         )
+
+    def __init__(self, x, y, tier=1, difficulty=1.0, rng=random):
+        super().__init__(x, y, stat_block(BossEnemy, tier, difficulty))
         self.color = (255, 80, 200)
-        self.tier = tier
         self.phase = 0
-        self.phase_timer = 0
 
     def update_special_behavior(self):
         # Boss alternates between normal and "rage" phase (faster speed/attacks)
-        if self.phase == 0:
-            if self.special_timer > 0:
-                self.special_timer -= 1
-            else:
-                self.phase = 1
-                self.speed *= 1.7
-                self.shot_cooldown = max(10, int(self.shot_cooldown * 0.5))
-                self.phase_timer = 90
-        elif self.phase == 1:
-            if self.phase_timer > 0:
-                self.phase_timer -= 1
-            else:
-                self.phase = 0
-                self.speed /= 1.7
-                self.shot_cooldown = int(self.shot_cooldown / 0.5)
-                self.special_timer = 180
-
-    def draw(self, surface):
-        # Unique boss look: octagon with spikes
-        cx = self.x + self.size // 2
-        cy = self.y + self.size // 2
-        base_color = (255, 80, 200) if not self.is_hit else (255,255,255)
+        if self.phase == 0 and Clock.now >= self.special_ready:
+            self.phase = 1
+            self.speed *= 1.7
+            self.shot_cooldown = max(10, int(self.shot_cooldown * 0.5))
+            self.timer_event = Clock.after(91, self._calm)
+
+    def _calm(self):
+        self.timer_event = None
+        self.phase = 0
+        self.speed /= 1.7
+        self.shot_cooldown = int(self.shot_cooldown / 0.5)
+        self.special_ready = Clock.now + 181
+
+    SPIKE = 18   # spike length past the octagon
+
+    @staticmethod
+    def render_sprite(size, color, alpha):
+        # Unique boss look: octagon with spikes, padded so the spikes fit
+        pad = BossEnemy.SPIKE + 3
+        surf = pygame.Surface((size + 2*pad + 1, size + 2*pad + 1), pygame.SRCALPHA)
+        cx = cy = pad + size // 2
         # Draw octagon
         oct_points = []
         num_sides = 8
-        r = self.size // 2
+        r = size // 2
         for i in range(num_sides):
             angle = 2 * math.pi * i / num_sides - math.pi / 8  # rotate a bit for visual appeal
             px = cx + r * math.cos(angle)
             py = cy + r * math.sin(angle)
             oct_points.append((px, py))
-        pygame.draw.polygon(surface, base_color, oct_points)
+        pygame.draw.polygon(surf, (*color, alpha), oct_points)
         # Draw spikes
         num_spikes = 8
-        r_outer = r + 18
+        r_outer = r + BossEnemy.SPIKE
         for i in range(num_spikes):
             angle = 2 * math.pi * i / num_spikes - math.pi / 8
             x1 = cx + r * math.cos(angle)
             y1 = cy + r * math.sin(angle)
             x2 = cx + r_outer * math.cos(angle)
             y2 = cy + r_outer * math.sin(angle)
-            pygame.draw.line(surface, (255, 180, 255), (x1, y1), (x2, y2), 5)
+            pygame.draw.line(surf, (255, 180, 255, alpha), (x1, y1), (x2, y2), 5)
+        return surf, pad
+
+    def draw(self, surface):
+        body = self.blit_sprite(surface, (255, 80, 200) if not self.is_hit else (255,255,255))
         # Health bar
         bar_width = self.size
         bar_height = 12
         bar_x = int(self.x)
         bar_y = int(self.y - 20)
-        draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(255,80,200), border_width=2)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(255,80,200), border_width=2))
 
 class FodderEnemy(BaseEnemy):
-    def __init__(self, x, y, tier=1):
+    __slots__ = ()
+
+    @staticmethod
+    def make_stats(tier, difficulty):
         # Fodder: very weak, low reward, fast, no ranged, melee only
         # Nerf late game: reduce scaling for tier 3/4
         if tier >= 3:
@@ -610,8 +744,9 @@ class FodderEnemy(BaseEnemy):
         shot_speed = 0
         shot_range = 0
         size = 18 + 2*(tier-1)
-        super().__init__(
-            x, y,
+        return _scaled(
+            difficulty,
+            tier=tier,
             speed=speed,
             health=health,
             damage=damage,
@@ -623,17 +758,31 @@ class FodderEnemy(BaseEnemy):
             can_shoot=False,
             melee_range=18+2*(tier-1),
             melee_damage=damage,
-            melee_cooldown=30
+            melee_cooldown=30,
         )
+
+    def __init__(self, x, y, tier=1, difficulty=1.0, rng=random):
+        super().__init__(x, y, stat_block(FodderEnemy, tier, difficulty))
         self.color = (180, 180, 180)
-        self.tier = tier
+
+    @staticmethod
+    def render_sprite(size, color, alpha):
+        surf = pygame.Surface((size + 1, size + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (size//2, size//2), size//2)
+        return surf, 0
 
     def draw(self, surface):
-        color = (220, 220, 220) if not self.is_hit else (255,255,255)
-        pygame.draw.circle(surface, color, (int(self.x + self.size/2), int(self.y + self.size/2)), self.size//2)
+        body = self.blit_sprite(surface, (220, 220, 220) if not self.is_hit else (255,255,255))
         # Health bar
         bar_width = self.size
         bar_height = 4
         bar_x = int(self.x)
         bar_y = int(self.y - 8)
-        draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(180,180,180), border_width=1)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health, color_fg=(180,180,180), border_width=1))
+
+
+# read-only access to the stat block, e.g. ``e.size`` for ``e.stats.size``
+for _name in EnemyStats._fields:
+    if not hasattr(BaseEnemy, _name):   # speed / shot_cooldown are live slots
+        setattr(BaseEnemy, _name, property(attrgetter("stats." + _name)))
+del _name
@@ -0,0 +1,101 @@
+import math
+import numpy as np
+
+from config import WIDTH, HEIGHT
+
+
+class FlowField:
+    """
+    Navigation grid over the play area: every cell stores the living
+    defender closest to its centre, as an index into the defender list
+    (player, towers..., central tower). Enemies sample the cell under them
+    and steer for that defender's current position, so a lookup costs the
+    same whatever the number of defenders.
+
+    The field is only recomputed when a defender changes cell, dies or is
+    placed. Only the player moves, so the towers' part is kept apart and a
+    player move just re-overlays the player's cells. The map has no
+    terrain, so the only obstacles are the defenders themselves: the cells
+    a tower covers belong to it, and an enemy whose way crosses a tower
+    goes for the tower instead of through it.
+    """
+    def __init__(self, cell_size=20):
+        self.cell_size = cs = cell_size
+        self.cols = -(-WIDTH // cs)
+        self.rows = -(-HEIGHT // cs)
+        gx = (np.arange(self.cols) + 0.5) * cs
+        gy = (np.arange(self.rows) + 0.5) * cs
+        self.px = np.tile(gx, self.rows)        # cell centres, row-major
+        self.py = np.repeat(gy, self.cols)
+        n = self.rows * self.cols
+        self.owner   = np.full(n, -1)
+        self._owner  = self.owner.tolist()      # same, for scalar lookups
+        self._clear  = [0.0] * n                # see clearance
+        # nearest of everything but the player: squared distance and index
+        self._rest_d2    = np.full(n, np.inf)
+        self._rest_owner = np.full(n, -1)
+        self._rest_key   = self._player_key = None
+        self.rebuilds = 0
+
+    def _key(self, d):
+        cs = self.cell_size
+        return (id(d), math.floor(d.x / cs), math.floor(d.y / cs)) if d.health > 0 else None
+
+    def update(self, defenders):
+        """Recompute if any defender moved cell, died or was added since last time."""
+        player, rest = defenders[0], defenders[1:]
+        rest_key   = tuple(self._key(d) for d in rest)
+        player_key = self._key(player)
+        if rest_key == self._rest_key and player_key == self._player_key:
+            return
+        self.rebuilds += 1
+        if rest_key != self._rest_key:
+            self._rest_key = rest_key
+            live = [k for k, d in enumerate(rest) if d.health > 0]
+            if live:
+                xs = np.array([rest[k].x for k in live], float)
+                ys = np.array([rest[k].y for k in live], float)
+                d2 = (self.px[:, None] - xs)**2 + (self.py[:, None] - ys)**2
+                # first minimum wins, like the strict '<' scans
+                near = np.argmin(d2, axis=1)
+                self._rest_d2    = d2[np.arange(len(near)), near]
+                self._rest_owner = np.array(live)[near] + 1
+            else:
+                self._rest_d2    = np.full(len(self.px), np.inf)
+                self._rest_owner = np.full(len(self.px), -1)
+        self._player_key = player_key
+        owner = self._rest_owner
+        hd = self.cell_size * math.sqrt(0.5)    # cell centre to corner
+        clear = np.sqrt(self._rest_d2) - hd
+        if player.health > 0:
+            # the player comes first in scan order, so it wins ties
+            d2 = (self.px - player.x)**2 + (self.py - player.y)**2
+            owner = np.where(d2 <= self._rest_d2, 0, owner)
+            # and it may wander anywhere in its cell before the next update
+            clear = np.minimum(clear, np.sqrt(d2) - 3*hd)
+        self.owner, self._owner = owner, owner.tolist()
+        self._clear = (clear - 1e-6).tolist()
+
+    def owner_at(self, x, y):
+        cs, cols = self.cell_size, self.cols
+        col, row = int(x // cs), int(y // cs)
+        if 0 <= col < cols and 0 <= row < self.rows:
+            return self._owner[row * cols + col]
+        col = min(max(col, 0), cols - 1)
+        row = min(max(row, 0), self.rows - 1)
+        return self._owner[row * cols + col]
+
+    def clearance(self, x, y):
+        """Lower bound on the distance from (x, y) to every living defender (0 off the grid)."""
+        cs, cols = self.cell_size, self.cols
+        col, row = int(x // cs), int(y // cs)
+        if 0 <= col < cols and 0 <= row < self.rows:
+            return self._clear[row * cols + col]
+        return 0.0
+
+    def owners(self, xs, ys):
+        """``owner_at`` over arrays of positions."""
+        cs = self.cell_size
+        col = np.clip((xs // cs).astype(int), 0, self.cols - 1)
+        row = np.clip((ys // cs).astype(int), 0, self.rows - 1)
+        return self.owner[row * self.cols + col]
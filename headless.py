@@ -0,0 +1,109 @@
+"""
+Display-free driver for the game simulation.
+
+Runs the regular GameState gameplay logic with no window, no drawing and no
+audio, one ``step(inputs)`` per fixed tick and as fast as the CPU allows.
+Mid-game cut-scenes are skipped; a run ends on victory or defeat.
+
+    python headless.py --ticks 20000 --difficulty 1.5
+    python headless.py --endless --immortal --wave 25   # load test from wave 25
+"""
+
+import argparse, os, time
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from state         import GameState, STATE_GAME
+from slides        import VICTORY_SLIDES, DEFEAT_SLIDES
+from music_manager import MusicManager
+from player        import PlayerInput
+from enemy         import build_stat_table
+from perf          import BudgetWatch
+
+IDLE = PlayerInput()
+
+
+class HeadlessGame:
+    def __init__(self, difficulty=1.0, seed=None, endless=False):
+        self.reset(difficulty, seed, endless)
+
+    def reset(self, difficulty=1.0, seed=None, endless=False):
+        MusicManager.enabled = False
+        GameState.init(None, seed)
+        GameState.difficulty    = difficulty
+        GameState.endless       = endless
+        build_stat_table(difficulty)
+        GameState.current_state = STATE_GAME
+        GameState.show_help     = False
+        self.ticks   = 0
+        self.done    = False
+        self.victory = False
+
+    @property
+    def state(self):
+        return GameState
+
+    def step(self, inputs: PlayerInput = None) -> bool:
+        """Apply one tick of input and advance; False once the run has ended."""
+        if self.done:
+            return False
+        if inputs is None:
+            inputs = IDLE
+        if inputs.place_tower:
+            GameState.place_tower()
+        for upg in inputs.buy:
+            GameState.upgrade_manager.try_buy(upg)
+        t0 = time.perf_counter()
+        GameState.tick(inputs)
+        GameState.note_frame((time.perf_counter() - t0) * 1000)
+        self.ticks += 1
+
+        if GameState.current_state != STATE_GAME:
+            if GameState.slide_list is DEFEAT_SLIDES:
+                self.done = True
+            elif GameState.slide_list is VICTORY_SLIDES:
+                self.done, self.victory = True, True
+            else:
+                GameState.current_state = STATE_GAME   # skip mid-game slides
+        return not self.done
+
+    def run(self, max_ticks, policy=None):
+        """Step until the run ends or ``max_ticks``; ``policy(game)`` supplies inputs."""
+        while self.ticks < max_ticks:
+            if not self.step(policy(self) if policy else None):
+                break
+        return self
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run the game simulation headless.")
+    ap.add_argument("--ticks", type=int, default=36000)
+    ap.add_argument("--difficulty", type=float, default=1.0)
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--memory", action="store_true", help="print bytes per entity at the end")
+    ap.add_argument("--endless", action="store_true", help="procedural waves after the last one")
+    ap.add_argument("--immortal", action="store_true",
+                    help="player and central tower cannot die, so enemies pile up")
+    ap.add_argument("--wave", type=int, default=1, help="wave to start on")
+    args = ap.parse_args()
+
+    game = HeadlessGame(args.difficulty, args.seed, args.endless)
+    if args.immortal:
+        for d in (GameState.player, GameState.central_tower):
+            d.max_health = d.health = float("inf")
+    GameState.wave_index = args.wave - 1
+    t0 = time.perf_counter()
+    game.run(args.ticks)
+    dt = time.perf_counter() - t0
+    outcome = "victory" if game.victory else "defeat" if game.done else "running"
+    print(f"{game.ticks} ticks in {dt:.2f}s ({game.ticks/dt:.0f} ticks/s) — "
+          f"wave {GameState.wave_index+1}, {outcome}")
+    if args.endless:
+        rec = BudgetWatch.record
+        print(f"over the {BudgetWatch.BUDGET_MS:.1f} ms tick budget from wave {rec[0]} "
+              f"({rec[1]} enemies, median {rec[2]:.2f} ms)" if rec else "never over the tick budget")
+    if args.memory:
+        GameState.print_memory()
+
+
+if __name__ == "__main__":
+    main()
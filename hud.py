@@ -1,8 +1,7 @@
-import pygame
 from config import WIDTH, WAVES, HUD_FONT_SIZE
+from text import Text
 
 def draw_hud(screen, player, central_tower, wave_index):
-    font = pygame.font.SysFont(None, HUD_FONT_SIZE)
     wave_label = wave_index+1 if wave_index < len(WAVES) else len(WAVES)
     hud_text = (
         f"Wave: {wave_label}/{len(WAVES)} | "
@@ -11,5 +10,5 @@ def draw_hud(screen, player, central_tower, wave_index):
         f"Tower HP: {int(central_tower.health)}/{central_tower.max_health} | "
         f"Press U for Upgrades | Press H for Help"
     )
-    surf = font.render(hud_text, True, (255, 255, 255))
+    surf = Text.render(hud_text, (255, 255, 255), HUD_FONT_SIZE)
     screen.blit(surf, (20, 20))
@@ -0,0 +1,71 @@
+import math
+import numpy as np
+
+class EnemyKinematics:
+    """
+    Optional batched movement stage for the enemy loop.
+
+    ``prepare`` runs every live enemy's special-behaviour hook (they only touch
+    the enemy's own timers and speed), gathers positions and speeds into
+    arrays and picks each enemy's defender from the ``DefenderIndex``'s
+    ``FlowField`` if it has one, or else from one enemies x defenders
+    distance matrix. The resulting step is applied in ``BaseEnemy.update`` at
+    that enemy's turn, so separation and attacks still see the same
+    sequential state as the scalar path.
+
+    ``np.hypot`` can round differently from ``math.hypot``, so enemies with
+    defenders tied for nearest (within ``EPS``) go to the index's own
+    ``nearest_defender``, and step lengths are taken with ``math.hypot``:
+    the steps are the scalar path's to the bit.
+    """
+    EPS = 1e-6
+
+    def __init__(self):
+        self.steps = []
+
+    def prepare(self, enemies, defenders):
+        live = [e for e in enemies if e.health > 0]
+        for e in live:
+            e.update_special_behavior()
+
+        # the field's index order, dead defenders included
+        defs  = defenders.defenders
+        alive = np.array([d.health > 0 for d in defs])
+        if not alive.any():
+            self.steps = [(0.0, 0.0, None) if e.health > 0 else None for e in enemies]
+            return
+
+        n  = len(live)
+        ex = np.fromiter((e.x for e in live), float, n)
+        ey = np.fromiter((e.y for e in live), float, n)
+        sp = np.fromiter((e.speed for e in live), float, n)
+        tx = np.array([d.x for d in defs], float)
+        ty = np.array([d.y for d in defs], float)
+
+        field = defenders.field
+        if field is not None:
+            near = field.owners(ex, ey)
+            lost = near < 0
+            lost[~lost] = ~alive[near[~lost]]
+        else:
+            near = np.empty(n, int)
+            lost = np.ones(n, bool)
+        if lost.any():
+            rows = np.flatnonzero(lost)
+            cand = np.flatnonzero(alive)
+            d = np.hypot(tx[cand][None, :] - ex[rows, None],
+                         ty[cand][None, :] - ey[rows, None])
+            near[rows] = cand[d.argmin(axis=1)]
+            tied = (d <= d.min(axis=1)[:, None] + self.EPS).sum(axis=1) > 1
+            for i in rows[tied].tolist():
+                near[i] = defs.index(defenders.nearest_defender(live[i]))
+        dx = tx[near] - ex
+        dy = ty[near] - ey
+        dist = np.fromiter(map(math.hypot, dx.tolist(), dy.tolist()), float, n)
+        moving = dist > 0
+        safe = np.where(moving, dist, 1.0)
+        sx = np.where(moving, (dx/safe)*sp, 0.0).tolist()
+        sy = np.where(moving, (dy/safe)*sp, 0.0).tolist()
+
+        it = zip(sx, sy, (defs[k] for k in near.tolist()))
+        self.steps = [next(it) if e.health > 0 else None for e in enemies]
@@ -1,7 +1,9 @@
 import pygame
 import sys
+import time
 from state import GameState
-from config import WIDTH, HEIGHT
+from perf import FrameProfiler
+from config import WIDTH, HEIGHT, TICK_RATE, MAX_TICKS_PER_FRAME
 import asyncio
 async def main():
     pygame.init()
@@ -10,17 +12,33 @@ async def main():
 
     GameState.init(screen)
 
+    tick_ms = 1000 / TICK_RATE
+    acc     = 0.0
     running = True
     while running:
         await asyncio.sleep(0)  # You must include this statement in your main loop. Keep the argument at 0.
-        clock.tick(60)
+        acc += clock.tick(60)
+        t0 = time.perf_counter()
+        FrameProfiler.start()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             else:
                 GameState.process_event(event)
-        GameState.update()
+        FrameProfiler.lap("events")
+        # fixed-rate simulation, as many ticks as the wall clock owes us
+        ticks = 0
+        while acc >= tick_ms and ticks < MAX_TICKS_PER_FRAME:
+            GameState.tick()
+            acc   -= tick_ms
+            ticks += 1
+        if ticks == MAX_TICKS_PER_FRAME:
+            acc = min(acc, tick_ms)  # too far behind: drop the backlog
+        GameState.draw(acc / tick_ms)
+        FrameProfiler.end_frame()
+        GameState.note_frame((time.perf_counter() - t0) * 1000)
 
+    GameState.stop_recording()
     pygame.quit()
     sys.exit()
 
@@ -16,9 +16,12 @@ class MusicManager:
     _tracks   : dict[str, list[str]] = {}
     _cur_mode : str | None = None
     _sfx_cache: dict[str, pygame.mixer.Sound] = {}
+    enabled   : bool = True   # False → every call is a no-op (headless runs)
 
     @classmethod
     def init(cls, volume: float = 0.7):
+        if not cls.enabled:
+            return
         pygame.mixer.init()
         pygame.mixer.music.set_volume(volume)
         for folder in os.listdir(MUSIC_ROOT):
@@ -32,6 +35,8 @@ class MusicManager:
 
     @classmethod
     def set_mode(cls, mode: str):
+        if not cls.enabled:
+            return
         if mode == cls._cur_mode or mode not in cls._tracks:
             return
         cls._cur_mode = mode
@@ -44,6 +49,8 @@ class MusicManager:
 
     @classmethod
     def fadeout(cls, ms: int = 1500):
+        if not cls.enabled:
+            return
         pygame.mixer.music.fadeout(ms)
 
     @classmethod
@@ -52,6 +59,8 @@ class MusicManager:
         Cross-platform SFX helper.
         ▸ Desktop  → pygame.mixer.Sound
         """
+        if not cls.enabled:
+            return
         path = os.path.join(MUSIC_ROOT, "sfx", name)
         if not os.path.isfile(path):
             print(f"[MusicManager] SFX file not found: {path}")
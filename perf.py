@@ -0,0 +1,161 @@
+import statistics, sys, time
+from collections import deque
+import pygame
+
+from config import TICK_RATE, PERF_WINDOW
+from text   import Text
+
+
+class FrameProfiler:
+    """
+    Per-stage frame timings for the F3 overlay. ``lap(stage)`` charges the
+    time since the previous lap (or ``start``) to ``stage``; a frame's laps
+    are summed (several ticks may run per frame) and pushed into a rolling
+    window by ``end_frame``. Does nothing while disabled.
+    """
+    STAGES = ("events", "player", "towers", "passives", "spawner", "enemies",
+              "proj_update", "collisions", "compaction",
+              "draw_world", "draw_hud", "draw_ui", "flip")
+    BUDGET_MS = 1000 / TICK_RATE
+
+    enabled = False
+    _t      = 0.0
+    _frame  = {}
+    _hist   = {}   # stage -> deque of ms, one per frame ("total" = all stages)
+    _surf   = None
+    _age    = 0
+
+    @classmethod
+    def toggle(cls):
+        cls.enabled = not cls.enabled
+        cls._hist   = {s: deque(maxlen=PERF_WINDOW) for s in (*cls.STAGES, "total")}
+        cls._frame  = {}
+        cls._surf   = None
+        cls._t      = time.perf_counter()
+
+    @classmethod
+    def start(cls):
+        if cls.enabled:
+            cls._t = time.perf_counter()
+
+    @classmethod
+    def lap(cls, stage):
+        if cls.enabled:
+            t = time.perf_counter()
+            cls._frame[stage] = cls._frame.get(stage, 0.0) + (t - cls._t)
+            cls._t = t
+
+    @classmethod
+    def end_frame(cls):
+        if not cls.enabled:
+            return
+        frame = cls._frame
+        frame["total"] = sum(frame.values())
+        for stage, hist in cls._hist.items():
+            hist.append(frame.get(stage, 0.0) * 1000)
+        frame.clear()
+
+    @staticmethod
+    def _stats(hist):
+        s = sorted(hist)
+        n = len(s)
+        return s[n // 2], s[min(n - 1, int(n * 0.95))], s[-1]
+
+    @classmethod
+    def draw(cls, surf, enemies, projectiles, towers):
+        """Overlay in the top-right corner; text is re-rendered every 15 frames."""
+        if not cls.enabled:
+            return
+        cls._age += 1
+        if cls._surf is None or cls._age >= 15:
+            cls._age  = 0
+            cls._surf = cls._render(enemies, projectiles, towers)
+        return surf.blit(cls._surf, (surf.get_width() - cls._surf.get_width() - 10, 40))
+
+    @classmethod
+    def _render(cls, enemies, projectiles, towers):
+        font = Text.font(22)   # numbers change every refresh: not worth caching
+        cols = (0, 180, 240, 300)   # stage | p50 | p95 | max (right edges)
+        rows = [(("stage", "p50", "p95", "max"), (255, 255, 120))]
+        for stage, hist in cls._hist.items():
+            if hist:
+                p50, p95, mx = cls._stats(hist)
+                color = (255, 90, 90) if p95 > cls.BUDGET_MS else (255, 255, 255)
+                rows.append(((stage, f"{p50:.2f}", f"{p95:.2f}", f"{mx:.2f}"), color))
+        counts = font.render(f"enemies {enemies}   projectiles {projectiles}   towers {towers}",
+                             True, (180, 255, 180))
+        w = max(cols[-1], counts.get_width()) + 16
+        out = pygame.Surface((w, 18 * (len(rows) + 1) + 12), pygame.SRCALPHA)
+        out.fill((0, 0, 0, 190))
+        for i, (cells, color) in enumerate(rows):
+            y = 6 + 18 * i
+            out.blit(font.render(cells[0], True, color), (8, y))
+            for x, txt in zip(cols[1:], cells[1:]):
+                r = font.render(txt, True, color)
+                out.blit(r, (8 + x - r.get_width(), y))
+        out.blit(counts, (8, 6 + 18 * len(rows)))
+        return out
+
+
+# ──────────────────────────────────────────────────────────
+#   endless mode load record
+# ──────────────────────────────────────────────────────────
+class BudgetWatch:
+    """
+    Remembers the first endless wave whose frames (headless: ticks) run
+    over budget, judged on the median of the last ``PERF_WINDOW`` samples.
+    Callers report ``record``; ``observe`` runs every frame and stays quiet.
+    """
+    BUDGET_MS = 1000 / TICK_RATE
+
+    _hist  = deque(maxlen=PERF_WINDOW)
+    record = None   # (wave number, live enemies, median ms) once over budget
+
+    @classmethod
+    def reset(cls):
+        cls._hist.clear()
+        cls.record = None
+
+    @classmethod
+    def observe(cls, ms, wave, enemies):
+        if cls.record is not None:
+            return
+        hist = cls._hist
+        hist.append(ms)
+        if len(hist) == hist.maxlen:
+            med = statistics.median(hist)
+            if med > cls.BUDGET_MS:
+                cls.record = (wave, enemies, med)
+
+
+# ──────────────────────────────────────────────────────────
+#   memory per entity (F4 / headless --memory)
+# ──────────────────────────────────────────────────────────
+def _entity_bytes(obj):
+    # the object, its __dict__ if it has one, and the values it owns;
+    # None, bools, cached small ints and enemy stat blocks are shared, so
+    # they are not counted
+    fields = (list(obj.__dict__.items()) if hasattr(obj, "__dict__") else
+              [(k, getattr(obj, k)) for c in type(obj).__mro__
+               for k in getattr(c, "__slots__", ()) if k != "stats" and hasattr(obj, k)])
+    size = sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0)
+    for _, v in fields:
+        if v is None or isinstance(v, bool) or (type(v) is int and -5 <= v <= 256):
+            continue
+        size += sys.getsizeof(v)
+        if type(v) is tuple:
+            size += sum(sys.getsizeof(x) for x in v if type(x) is float)
+    return size
+
+def memory_report(player, central_tower, towers, enemies, projectiles):
+    """Lines of 'type  count  bytes/entity' for every live entity kind."""
+    groups = {}
+    for ent in (player, central_tower, *towers, *enemies):
+        groups.setdefault(type(ent).__name__, []).append(_entity_bytes(ent))
+    lines = [f"{'type':<16}{'live':>6}{'bytes/entity':>14}"]
+    for name, sizes in sorted(groups.items()):
+        lines.append(f"{name:<16}{len(sizes):>6}{sum(sizes) / len(sizes):>14.0f}")
+    per_proj = projectiles.bytes_per_slot()
+    lines.append(f"{'projectile':<16}{len(projectiles):>6}{per_proj:>14.0f}"
+                 f"   (NumPy store, {projectiles.capacity} slots)")
+    return lines
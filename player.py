@@ -1,11 +1,40 @@
 import pygame, math
 from typing import List
-from projectile import Projectile          # <-- existing class
+from projectile import ProjectileStore
 from enemy import BaseEnemy
 from utils import draw_health_bar
 from music_manager import MusicManager  # <-- add this import
+from timers import Clock
+
+class PlayerInput:
+    """
+    One tick of player controls. The live game polls pygame for it; headless
+    runs and replays construct it directly.
+    """
+    def __init__(self, left=False, right=False, up=False, down=False,
+                 fire=False, aim=(0, 0), place_tower=False, buy=()):
+        self.left, self.right = left, right
+        self.up, self.down    = up, down
+        self.fire        = fire
+        self.aim         = aim
+        self.place_tower = place_tower   # discrete actions, headless only;
+        self.buy         = buy           # the live game gets them as events
+
+    @classmethod
+    def poll(cls):
+        keys = pygame.key.get_pressed()
+        return cls(left=keys[pygame.K_a], right=keys[pygame.K_d],
+                   up=keys[pygame.K_w], down=keys[pygame.K_s],
+                   fire=pygame.mouse.get_pressed()[0],
+                   aim=pygame.mouse.get_pos())
+
 
 class Player:
+    __slots__ = ("x", "y", "prev_x", "prev_y", "radius", "speed",
+                 "max_health", "health", "money",
+                 "bullet_damage", "bullet_speed", "fire_cooldown", "fire_ready",
+                 "iframes_max", "iframes_until")
+
     def __init__(self, x, y,
                  radius=20, speed=5,
                  max_health=50,
@@ -14,6 +43,7 @@ class Player:
                  fire_cooldown=24):  
         # -------------------------------------------------- stats / movement
         self.x, self.y   = x, y
+        self.prev_x, self.prev_y = x, y   # position last tick (render lerp)
         self.radius      = radius
         self.speed       = speed
 
@@ -25,48 +55,49 @@ class Player:
         self.bullet_damage   = bullet_damage
         self.bullet_speed    = bullet_speed
         self.fire_cooldown   = fire_cooldown   # frames between shots
-        self.fire_timer      = 0               # counts down to 0
+        self.fire_ready      = 0               # Clock tick the next shot is allowed on
 
         # -------------------------------------------------- invincibility
-        self.iframes_max = 60
-        self.iframes     = 0
+        self.iframes_max   = 60
+        self.iframes_until = 0
 
     # ================================================================ UPDATE
-    def update(self, W, H, enemies: List[BaseEnemy], projectiles: List[Projectile]):
+    def update(self, W, H, enemies: List[BaseEnemy], projectiles: ProjectileStore,
+               inputs: PlayerInput = None):
+        if inputs is None:
+            inputs = PlayerInput.poll()
         # -------- movement (W A S D) ---------------------------------------
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_a]: self.x -= self.speed
-        if keys[pygame.K_d]: self.x += self.speed
-        if keys[pygame.K_w]: self.y -= self.speed
-        if keys[pygame.K_s]: self.y += self.speed
+        if inputs.left:  self.x -= self.speed
+        if inputs.right: self.x += self.speed
+        if inputs.up:    self.y -= self.speed
+        if inputs.down:  self.y += self.speed
         self.x = max(self.radius, min(W - self.radius, self.x))
         self.y = max(self.radius, min(H - self.radius, self.y))
 
         # -------- shoot while LMB pressed ---------------------------------
-        if self.fire_timer: self.fire_timer -= 1
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        if mouse_pressed and self.fire_timer == 0:
-            mx, my = pygame.mouse.get_pos()
+        if inputs.fire and Clock.now >= self.fire_ready:
+            mx, my = inputs.aim
             dx, dy = mx - self.x, my - self.y
             dist   = math.hypot(dx, dy)
             if dist:      # create a bullet
                 vx, vy = dx / dist, dy / dist
-                projectiles.append(
-                    Projectile(self.x, self.y, vx, vy,
-                               speed=self.bullet_speed,
-                               damage=self.bullet_damage,
-                               is_friendly=True))
-                self.fire_timer = self.fire_cooldown
+                projectiles.spawn(self.x, self.y, vx, vy,
+                                  speed=self.bullet_speed,
+                                  damage=self.bullet_damage,
+                                  is_friendly=True)
+                self.fire_ready = Clock.now + self.fire_cooldown
                 MusicManager.play_sfx("laser.ogg")  # <-- play sound effect
 
-        # -------- invincibility frames -----------------------------------
-        if self.iframes: self.iframes -= 1
-
     # ================================================================ MISC
+    @property
+    def iframes(self):
+        # invincibility ticks left
+        return max(0, self.iframes_until - Clock.now)
+
     def take_damage(self, dmg):
         if self.iframes: return
         self.health  = max(0, self.health - dmg)
-        self.iframes = self.iframes_max
+        self.iframes_until = Clock.now + self.iframes_max
         MusicManager.play_sfx("hurt.ogg")  # <-- play hurt sound
 
     # ================================================================ DRAW
@@ -74,10 +105,10 @@ class Player:
         # flicker while invincible
         flick = self.iframes and (self.iframes // 5) % 2
         col   = (200,200,200) if flick else (255,255,255)
-        pygame.draw.circle(surf, col, (int(self.x), int(self.y)), self.radius)
+        body = pygame.draw.circle(surf, col, (int(self.x), int(self.y)), self.radius)
 
         # health bar
-        draw_health_bar(surf,
+        bar = draw_health_bar(surf,
                         self.x - self.radius, self.y - self.radius - 18,
                         self.radius*2, 8,
                         self.health, self.max_health)
@@ -90,3 +121,4 @@ class Player:
         pygame.draw.line(surf, (0,0,0),
                          (self.x - self.radius//2, self.y + self.radius//4),
                          (self.x + self.radius//2, self.y + self.radius//4), 2)
+        return body.union(bar)
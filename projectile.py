@@ -1,7 +1,11 @@
 import pygame
 import math
+import numpy as np
 
 class Projectile:
+    __slots__ = ("x", "y", "dx", "dy", "speed", "damage", "is_friendly",
+                 "radius", "color", "alive")
+
     def __init__(self, x, y, dx, dy,
                  speed=5, damage=5,
                  is_friendly=True,
@@ -28,3 +32,113 @@ class Projectile:
     def draw(self,surface):
         if self.alive:
             pygame.draw.circle(surface,self.color,(int(self.x),int(self.y)),self.radius)
+
+
+class ProjectileStore:
+    """
+    Struct-of-arrays home for every live projectile.
+
+    Shooters call ``spawn`` with the same arguments ``Projectile`` takes (or
+    ``append`` an existing ``Projectile``); the whole population is then
+    integrated and culled in one vectorized ``update``. Slots ``[0, n)`` are
+    in spawn order, which ``compact`` preserves.
+    """
+    def __init__(self, capacity=256):
+        self.n = 0
+        self._alloc(capacity)
+
+    def _alloc(self, cap):
+        self.x        = np.zeros(cap)
+        self.y        = np.zeros(cap)
+        self.px       = np.zeros(cap)   # position last tick, for render lerp
+        self.py       = np.zeros(cap)
+        self.dx       = np.zeros(cap)
+        self.dy       = np.zeros(cap)
+        self.speed    = np.zeros(cap)
+        self.damage   = np.zeros(cap)
+        self.radius   = np.zeros(cap)
+        self.friendly = np.zeros(cap, dtype=bool)
+        self.alive    = np.zeros(cap, dtype=bool)
+        self.color    = np.zeros((cap, 3), dtype=np.uint8)
+
+    _FIELDS = ("x", "y", "px", "py", "dx", "dy", "speed", "damage", "radius",
+               "friendly", "alive", "color")
+
+    def _grow(self):
+        old = {f: getattr(self, f) for f in self._FIELDS}
+        self._alloc(len(self.x) * 2)
+        for f, arr in old.items():
+            getattr(self, f)[:self.n] = arr[:self.n]
+
+    @property
+    def capacity(self):
+        return len(self.x)
+
+    def bytes_per_slot(self):
+        return sum(getattr(self, f).nbytes for f in self._FIELDS) / self.capacity
+
+    def spawn(self, x, y, dx, dy,
+              speed=5, damage=5,
+              is_friendly=True,
+              radius=5,
+              color=(255,255,0)):
+        if self.n == len(self.x):
+            self._grow()
+        i = self.n
+        self.x[i], self.y[i]   = x, y
+        self.px[i], self.py[i] = x, y
+        self.dx[i], self.dy[i] = dx, dy
+        self.speed[i]    = speed
+        self.damage[i]   = damage
+        self.radius[i]   = radius
+        self.friendly[i] = is_friendly
+        self.alive[i]    = True
+        self.color[i]    = color
+        self.n += 1
+
+    def append(self, p: Projectile):
+        self.spawn(p.x, p.y, p.dx, p.dy, speed=p.speed, damage=p.damage,
+                   is_friendly=p.is_friendly, radius=p.radius, color=p.color)
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def snapshot(self):
+        n = self.n
+        self.px[:n] = self.x[:n]
+        self.py[:n] = self.y[:n]
+
+    def update(self, w, h):
+        n = self.n
+        x, y = self.x[:n], self.y[:n]
+        x += self.dx[:n] * self.speed[:n]
+        y += self.dy[:n] * self.speed[:n]
+        self.alive[:n] &= (x >= 0) & (x <= w) & (y >= 0) & (y <= h)
+
+    def compact(self):
+        n = self.n
+        m = int(np.count_nonzero(self.alive[:n]))
+        if m == n: return
+        keep = self.alive[:n].copy()   # alive itself gets compacted below
+        for f in self._FIELDS:
+            arr = getattr(self, f)
+            arr[:m] = arr[:n][keep]
+        self.n = m
+
+    def draw(self, surface, alpha=1.0):
+        n = self.n
+        idx = np.flatnonzero(self.alive[:n])
+        x, y = self.x[idx], self.y[idx]
+        if alpha != 1.0:
+            px, py = self.px[idx], self.py[idx]
+            x = px + (x - px)*alpha
+            y = py + (y - py)*alpha
+        xs = x.astype(int).tolist()
+        ys = y.astype(int).tolist()
+        rs = self.radius[idx].astype(int).tolist()
+        cs = self.color[idx].tolist()
+        circle = pygame.draw.circle
+        return [circle(surface, c, (x, y), r) for x, y, r, c in zip(xs, ys, rs, cs)]
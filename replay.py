@@ -0,0 +1,176 @@
+"""
+Input recording and bit-exact replay.
+
+A replay is the run's RNG seed, difficulty and mode plus the controls of every
+simulated tick (ticks paused behind the help or upgrade overlay and
+cut-scene ticks change nothing, so they are not stored). Tower placements and
+upgrade purchases are attached to the tick they preceded. Playback feeds the
+same inputs through ``HeadlessGame`` at full speed.
+
+Inputs only reproduce a run on the simulation that recorded it, so files
+from an older ``VERSION``, or recorded with different ``SIM_SETTINGS``, are
+refused rather than played out differently. Bump ``VERSION`` with any change
+that alters the simulation.
+
+File layout: ``MAGIC``, header ``<HQd`` (version, seed, difficulty), an
+endless-mode byte, the settings fingerprint as ``<I``, then a zlib stream of
+per-tick records: one flag byte, the aim as ``<hh`` when it changed, and
+the purchased upgrade ids when there are any.
+
+    python replay.py replays/run.pfpr [--repeat 5] [--profile]
+"""
+
+import argparse, os, struct, time, zlib
+
+import config
+from player   import PlayerInput
+from upgrades import UpgradeType
+
+MAGIC   = b"PFPR"
+VERSION = 3   # 2: no fingerprint, before the flow field; 1: no endless byte
+_HEADER = struct.Struct("<HQd")
+_PRINT  = struct.Struct("<I")
+_AIM    = struct.Struct("<hh")
+
+# config that changes what the simulation does; switches that only change
+# how fast it gets there (batching, culls) stay out
+SIM_SETTINGS = ("TICK_RATE", "FLOW_FIELD_CELL")
+
+
+def sim_fingerprint():
+    return zlib.crc32(repr([getattr(config, k) for k in SIM_SETTINGS]).encode())
+
+# flag byte
+_LEFT, _RIGHT, _UP, _DOWN, _FIRE, _TOWER, _BUYS, _AIM_CHANGED = (1 << i for i in range(8))
+
+
+class ReplayRecorder:
+    def __init__(self, seed, difficulty, endless=False):
+        self.seed       = seed
+        self.difficulty = difficulty
+        self.endless    = endless
+        self.ticks      = 0
+        self._body      = bytearray()
+        self._aim       = (0, 0)
+        self._tower     = False
+        self._buys      = []
+
+    # actions happen between ticks, on events
+    def note_tower(self):
+        self._tower = True
+
+    def note_buy(self, upg: UpgradeType):
+        self._buys.append(upg.value)
+
+    def record(self, inp: PlayerInput):
+        flags = ((_LEFT  if inp.left  else 0) | (_RIGHT if inp.right else 0) |
+                 (_UP    if inp.up    else 0) | (_DOWN  if inp.down  else 0) |
+                 (_FIRE  if inp.fire  else 0) | (_TOWER if self._tower else 0) |
+                 (_BUYS  if self._buys else 0))
+        aim = (int(inp.aim[0]), int(inp.aim[1]))
+        if aim != self._aim:
+            flags |= _AIM_CHANGED
+        body = self._body
+        body.append(flags)
+        if flags & _AIM_CHANGED:
+            body += _AIM.pack(*aim)
+            self._aim = aim
+        if self._buys:
+            body.append(len(self._buys))
+            body += bytes(self._buys)
+        self._tower = False
+        self._buys.clear()
+        self.ticks += 1
+
+    def to_bytes(self) -> bytes:
+        return (MAGIC + _HEADER.pack(VERSION, self.seed, self.difficulty)
+                + bytes((self.endless,)) + _PRINT.pack(sim_fingerprint())
+                + zlib.compress(bytes(self._body), 9))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class Replay:
+    def __init__(self, seed, difficulty, inputs, endless=False):
+        self.seed       = seed
+        self.difficulty = difficulty
+        self.inputs     = inputs   # one PlayerInput per simulated tick
+        self.endless    = endless
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        if data[:4] != MAGIC:
+            raise ValueError("not a replay file")
+        version, seed, difficulty = _HEADER.unpack_from(data, 4)
+        if version != VERSION:
+            raise ValueError(f"replay version {version} was recorded on another "
+                             f"simulation (this one plays version {VERSION})")
+        i = 4 + _HEADER.size
+        endless = bool(data[i])
+        (fingerprint,) = _PRINT.unpack_from(data, i + 1)
+        if fingerprint != sim_fingerprint():
+            raise ValueError("replay was recorded with other simulation settings "
+                             f"({', '.join(SIM_SETTINGS)})")
+        body = zlib.decompress(data[i + 1 + _PRINT.size:])
+        inputs, aim, i = [], (0, 0), 0
+        while i < len(body):
+            flags = body[i]; i += 1
+            if flags & _AIM_CHANGED:
+                aim = _AIM.unpack_from(body, i); i += _AIM.size
+            buys = ()
+            if flags & _BUYS:
+                k = body[i]
+                buys = tuple(UpgradeType(v) for v in body[i+1:i+1+k]); i += 1 + k
+            inputs.append(PlayerInput(
+                left=bool(flags & _LEFT), right=bool(flags & _RIGHT),
+                up=bool(flags & _UP), down=bool(flags & _DOWN),
+                fire=bool(flags & _FIRE), aim=aim,
+                place_tower=bool(flags & _TOWER), buy=buys))
+        return cls(seed, difficulty, inputs, endless)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def play(self):
+        """Re-run the recorded game headless, unthrottled; returns the HeadlessGame."""
+        from headless import HeadlessGame
+        game = HeadlessGame(self.difficulty, seed=self.seed, endless=self.endless)
+        for inp in self.inputs:
+            if not game.step(inp):
+                break
+        return game
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Play back a recorded game headless.")
+    ap.add_argument("path")
+    ap.add_argument("--repeat", type=int, default=1, help="play it this many times")
+    ap.add_argument("--profile", action="store_true", help="run under cProfile")
+    args = ap.parse_args()
+
+    rep = Replay.load(args.path)
+    print(f"seed {rep.seed}, difficulty {rep.difficulty:.2f}{', endless' if rep.endless else ''}, "
+          f"{len(rep.inputs)} ticks")
+    if args.profile:
+        import cProfile, pstats
+        prof = cProfile.Profile()
+        prof.runcall(rep.play)
+        pstats.Stats(prof).sort_stats("cumulative").print_stats(25)
+        return
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        game = rep.play()
+        dt = time.perf_counter() - t0
+        st = game.state
+        outcome = "victory" if game.victory else "defeat" if game.done else "unfinished"
+        print(f"{game.ticks} ticks in {dt:.2f}s ({game.ticks/dt:.0f} ticks/s) — "
+              f"wave {st.wave_index+1}, {outcome}, money {st.player.money:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import math
+import numpy as np
+
+class SpatialHash:
+    """
+    Uniform grid over enemy top-left positions, used by the separation pass.
+    Rebuilt once per tick by the game loop; enemies that move during the tick
+    re-bucket themselves via ``move`` so queries always see live cells.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells     = {}   # (cx, cy) -> [index, ...]
+        self.entities  = []   # index -> entity (the list passed to rebuild)
+        self.keys      = []   # index -> current cell key
+        self.index_of  = {}   # id(entity) -> index
+        self.max_size  = 0
+
+    def _key(self, x, y):
+        cs = self.cell_size
+        return (math.floor(x / cs), math.floor(y / cs))
+
+    def rebuild(self, entities):
+        self.cells.clear()
+        self.index_of.clear()
+        self.entities = entities
+        self.keys     = [None] * len(entities)
+        self.max_size = 0
+        for i, e in enumerate(entities):
+            key = self._key(e.x, e.y)
+            self.cells.setdefault(key, []).append(i)
+            self.keys[i] = key
+            self.index_of[id(e)] = i
+            if e.size > self.max_size:
+                self.max_size = e.size
+
+    def move(self, e):
+        i = self.index_of.get(id(e))
+        if i is None: return
+        key = self._key(e.x, e.y)
+        old = self.keys[i]
+        if key == old: return
+        self.cells[old].remove(i)
+        self.cells.setdefault(key, []).append(i)
+        self.keys[i] = key
+
+    def _box(self, x, y, reach):
+        cs = self.cell_size
+        return (math.floor((x - reach) / cs), math.floor((y - reach) / cs),
+                math.floor((x + reach) / cs), math.floor((y + reach) / cs))
+
+    def _collect(self, box):
+        x0, y0, x1, y1 = box
+        cells, out = self.cells, []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket: out.extend(bucket)
+        out.sort()
+        return out
+
+    def query(self, x, y, reach):
+        """Indices of everything bucketed within ``reach`` of (x, y), in list order."""
+        return self._collect(self._box(x, y, reach))
+
+    def neighbours(self, e, reach):
+        """
+        Yield entities that may lie within ``reach`` of ``e``, in list order.
+        ``e`` may move while iterating (separation pushes it); whenever it
+        leaves the queried cells the newly covered cells are merged in, so
+        every later entity within reach at its turn is still visited.
+        """
+        box     = self._box(e.x, e.y, reach)
+        pending = self._collect(box)
+        seen    = set(pending)
+        ents    = self.entities
+        k = 0
+        while k < len(pending):
+            i = pending[k]; k += 1
+            yield ents[i]
+            nb = self._box(e.x, e.y, reach)
+            if nb[0] < box[0] or nb[1] < box[1] or nb[2] > box[2] or nb[3] > box[3]:
+                box   = nb
+                extra = [j for j in self._collect(nb) if j > i and j not in seen]
+                if extra:
+                    seen.update(extra)
+                    pending = sorted(pending[k:] + extra); k = 0
+
+
+class HitGrid:
+    """
+    Per-frame collision broadphase for one faction's bodies (circles given by
+    centre and radius). Filled once per frame with ``add`` and then only read,
+    so projectiles test just the bodies bucketed around them.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size  = cell_size
+        self.cells      = {}   # (cx, cy) -> [index, ...]
+        self.bodies     = []
+        self.cx         = []
+        self.cy         = []
+        self.r          = []
+        self.max_radius = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.bodies.clear(); self.cx.clear(); self.cy.clear(); self.r.clear()
+        self.max_radius = 0
+
+    def add(self, body, cx, cy, r):
+        cs = self.cell_size
+        key = (math.floor(cx / cs), math.floor(cy / cs))
+        self.cells.setdefault(key, []).append(len(self.bodies))
+        self.bodies.append(body)
+        self.cx.append(cx); self.cy.append(cy); self.r.append(r)
+        if r > self.max_radius:
+            self.max_radius = r
+
+    def query(self, x, y, radius):
+        """Indices of bodies that may overlap a circle at (x, y), in insertion order."""
+        cs    = self.cell_size
+        reach = self.max_radius + radius
+        x0, x1 = math.floor((x - reach) / cs), math.floor((x + reach) / cs)
+        y0, y1 = math.floor((y - reach) / cs), math.floor((y + reach) / cs)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), ())
+        out = []
+        for gx in range(x0, x1 + 1):
+            for gy in range(y0, y1 + 1):
+                bucket = cells.get((gx, gy))
+                if bucket: out.extend(bucket)
+        out.sort()
+        return out
+
+    def cover_mask(self, xs, ys, radius):
+        """
+        Vectorized pre-test: True for every point (xs[k], ys[k]) whose circle
+        of ``radius`` could reach a body, i.e. lies in or next to an occupied
+        cell. Points that come back False cannot hit anything.
+        """
+        if not self.bodies or len(xs) == 0:
+            return np.zeros(len(xs), dtype=bool)
+        cs    = self.cell_size
+        reach = self.max_radius + radius
+        keys  = list(self.cells)
+        gx0 = min(k[0] for k in keys) - 1; gx1 = max(k[0] for k in keys) + 1
+        gy0 = min(k[1] for k in keys) - 1; gy1 = max(k[1] for k in keys) + 1
+        span = math.ceil(reach / cs)
+        occ  = np.zeros((gx1 - gx0 + 1 + 2*span, gy1 - gy0 + 1 + 2*span), dtype=bool)
+        for gx, gy in keys:
+            ox, oy = gx - gx0 + span, gy - gy0 + span
+            occ[ox-span:ox+span+1, oy-span:oy+span+1] = True
+        px = np.floor(xs / cs).astype(np.int64) - gx0 + span
+        py = np.floor(ys / cs).astype(np.int64) - gy0 + span
+        inside = (px >= 0) & (px < occ.shape[0]) & (py >= 0) & (py < occ.shape[1])
+        out = np.zeros(len(xs), dtype=bool)
+        out[inside] = occ[px[inside], py[inside]]
+        return out
@@ -22,20 +22,35 @@ Music/
 Simply drop any number of tracks into those sub‑folders.
 """
 
-import os, sys, random, math
+import os, sys, random, math, time
+from functools import lru_cache
 import pygame
+import numpy as np
 
-from config      import WIDTH, HEIGHT
+from config      import (WIDTH, HEIGHT, BATCH_KINEMATICS_MIN_ENEMIES, FLOW_FIELD_CELL,
+                         CULL_BY_CLEARANCE, DIRTY_RECTS,
+                         RECORD_REPLAYS, REPLAY_DIR)
 from slides      import (INTRO_SLIDES, MID_SLIDES_A, MID_SLIDES_B,
                          VICTORY_SLIDES, DEFEAT_SLIDES)
-from waves       import WAVES
-from player      import Player
+from waves       import WAVES, wave_def
+from player      import Player, PlayerInput
 from tower       import CentralTower, PlayerTower
-from enemy       import spawn_enemy
-from projectile  import Projectile
+from enemy       import release_enemy, build_stat_table
+from projectile  import ProjectileStore
+from spatial     import SpatialHash, HitGrid
+from kinematics  import EnemyKinematics
+from targeting   import TowerTargeting
+from defenders   import DefenderIndex
+from flowfield   import FlowField
 from upgrades    import UpgradeManager, UpgradeMenu
 from instructions import draw_instructions
 from music_manager import MusicManager, MusicMode    # ← NEW
+from replay      import ReplayRecorder
+from perf        import FrameProfiler, BudgetWatch, memory_report
+from timers      import Clock
+from timeline    import WaveTimeline
+from text        import Text
+from dirty       import DirtyRects
 
 # ──────────────────────────────────────────────────────────
 #   high‑level states
@@ -58,7 +73,16 @@ class GameState:
     central_tower: CentralTower  = None
     towers                       = []
     enemies                      = []
-    projectiles                  = []
+    projectiles                  = ProjectileStore()
+    enemy_grid                   = SpatialHash()
+    enemy_hits                   = HitGrid()   # collision broadphase,
+    defender_hits                = HitGrid()   # rebuilt every frame
+    kinematics                   = EnemyKinematics()
+    targeting                    = TowerTargeting()
+    defender_index               = DefenderIndex(field=FlowField(FLOW_FIELD_CELL) if FLOW_FIELD_CELL else None,
+                                                 cull=CULL_BY_CLEARANCE)
+    batch_kinematics_min         = BATCH_KINEMATICS_MIN_ENEMIES
+    dirty_rects                  = DIRTY_RECTS
 
     upgrade_manager: UpgradeManager = None
     upgrade_menu:    UpgradeMenu    = None
@@ -66,14 +90,17 @@ class GameState:
     show_help      = True
 
     difficulty = 1.0  # Default difficulty (1.0 = normal)
+    endless    = False  # procedural waves after the list, no victory
+    seed       = 0     # every gameplay random draw comes from rng
+    rng        = random.Random(0)
+    recorder: ReplayRecorder = None
     mainmenu_slider = 1.0  # For UI slider
     mainmenu_slider_drag = False
 
     # wave bookkeeping
     wave_index        = 0
-    step_index        = 0
-    remaining_in_step = 0
-    spawn_timer       = 0
+    timeline: WaveTimeline      = None  # the running (or last) wave
+    next_timeline: WaveTimeline = None  # compiled ahead, during cut-scenes
     wave_running      = False
     wave_timer        = 0  # Add a timer for the current wave
     wave_time_limit   = 3600  # 1 minute at 60fps (default, but will be set per-wave)
@@ -91,12 +118,18 @@ class GameState:
     #                        INIT / RESET
     # --------------------------------------------------------------
     @classmethod
-    def init(cls, scr: pygame.Surface):
+    def init(cls, scr: pygame.Surface, seed=None):
+        cls.stop_recording()
         cls.screen        = scr
+        cls.seed          = seed if seed is not None else random.randrange(2**63)
+        cls.rng           = random.Random(cls.seed)
         cls.current_state = STATE_MAINMENU  # Start at main menu
         cls.slide_list    = INTRO_SLIDES
         cls.slide_index   = 0
         cls.mid_a_shown   = cls.mid_b_shown = False
+        cls.endless       = False
+        BudgetWatch.reset()
+        Clock.reset()
 
         # music system -------------------------------------------------
         MusicManager.init()          # scans sub‑folders
@@ -111,13 +144,15 @@ class GameState:
             shot_damage=6,  shot_range=350
         )
         cls.towers.clear()
+        for e in cls.enemies: release_enemy(e)
+        for tl in (cls.timeline, cls.next_timeline):
+            if tl is not None: tl.discard()
         cls.enemies.clear()
         cls.projectiles.clear()
 
         cls.wave_index        = 0
-        cls.step_index        = 0
-        cls.remaining_in_step = 0
-        cls.spawn_timer       = 0
+        cls.timeline          = None
+        cls.next_timeline     = None
         cls.wave_running      = False
         cls.wave_timer        = 0
 
@@ -131,6 +166,11 @@ class GameState:
 
     @classmethod
     def process_event(cls, e: pygame.event.Event):
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_F3:
+            FrameProfiler.toggle(); return
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_F4:
+            cls.print_memory(); return
+
         # ---------- main menu ----------
         if cls.current_state == STATE_MAINMENU:
             if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
@@ -142,12 +182,16 @@ class GameState:
                     cls.mainmenu_slider_drag = True
                     cls._mainmenu_update_slider(mx)
                     return  # Don't start game if slider is clicked
-                # Start button
+                # Start / endless buttons
                 btn_rect = cls._mainmenu_btn_rect()
                 btn_rect.y += 90  # match the y-offset in _draw_mainmenu
-                if btn_rect.collidepoint(mx, my):
+                endless_rect = cls._mainmenu_endless_rect()
+                if btn_rect.collidepoint(mx, my) or endless_rect.collidepoint(mx, my):
                     cls.difficulty = cls.mainmenu_slider
-                    pygame.difficulty = cls.difficulty  # <-- Set global difficulty for enemy.py
+                    cls.endless    = endless_rect.collidepoint(mx, my)
+                    build_stat_table(cls.difficulty)
+                    if RECORD_REPLAYS:
+                        cls.recorder = ReplayRecorder(cls.seed, cls.difficulty, cls.endless)
                     cls.current_state = STATE_SLIDES
                     MusicManager.set_mode(MusicMode.INTRO)
                     return
@@ -178,6 +222,7 @@ class GameState:
         elif cls.current_state in (STATE_VICTORY, STATE_DEFEAT):
             if e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_ESCAPE:
+                    cls.stop_recording()
                     pygame.quit(); sys.exit()
                 elif e.key == pygame.K_r:
                     cls.init(cls.screen)
@@ -188,7 +233,9 @@ class GameState:
                 if e.type == pygame.KEYDOWN and e.key in (pygame.K_u, pygame.K_ESCAPE, pygame.K_SPACE):
                     cls.show_upgrades = False
                 elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-                    cls.upgrade_menu.handle_mouse(e.pos, cls.player)
+                    upg = cls.upgrade_menu.handle_mouse(e.pos, cls.player)
+                    if upg is not None and cls.recorder:
+                        cls.recorder.note_buy(upg)
             elif cls.show_help:
                 if e.type == pygame.KEYDOWN and e.key in (pygame.K_h, pygame.K_SPACE, pygame.K_ESCAPE):
                     cls.show_help = False
@@ -198,28 +245,38 @@ class GameState:
                         cls.show_upgrades = True
                     elif e.key == pygame.K_h:
                         cls.show_help = True
-                    elif e.key == pygame.K_t and cls.player.money >= 50:
-                        # Prevent placing towers on top of each other
-                        px, py = cls.player.x, cls.player.y
-                        min_dist = 20  # Minimum allowed distance between towers
-                        too_close = False
-                        for t in cls.towers:
-                            dist = math.hypot(t.x - px, t.y - py)
-                            if dist < t.radius + 25 + min_dist:
-                                too_close = True
-                                break
-                        # Also prevent placing on top of central tower
-                        dist_central = math.hypot(cls.central_tower.x - px, cls.central_tower.y - py)
-                        if dist_central < cls.central_tower.radius + 25 + min_dist:
-                            too_close = True
-                        if not too_close:
-                            cls.towers.append(PlayerTower(
-                                x=px, y=py,
-                                max_health=80, radius=25,
-                                shot_cooldown=60, shot_speed=5,
-                                shot_damage=4,  shot_range=200))
-                            cls.player.money -= 50
-                        # Optionally: else play error sound or flash message
+                    elif e.key == pygame.K_t:
+                        if cls.place_tower() and cls.recorder:
+                            cls.recorder.note_tower()
+
+    @classmethod
+    def place_tower(cls):
+        """Buy a tower at the player's position; False if too poor or too close."""
+        if cls.player.money < 50:
+            return False
+        # Prevent placing towers on top of each other
+        px, py = cls.player.x, cls.player.y
+        min_dist = 20  # Minimum allowed distance between towers
+        too_close = False
+        for t in cls.towers:
+            dist = math.hypot(t.x - px, t.y - py)
+            if dist < t.radius + 25 + min_dist:
+                too_close = True
+                break
+        # Also prevent placing on top of central tower
+        dist_central = math.hypot(cls.central_tower.x - px, cls.central_tower.y - py)
+        if dist_central < cls.central_tower.radius + 25 + min_dist:
+            too_close = True
+        if too_close:
+            # Optionally: play error sound or flash message
+            return False
+        cls.towers.append(PlayerTower(
+            x=px, y=py,
+            max_health=80, radius=25,
+            shot_cooldown=60, shot_speed=5,
+            shot_damage=4,  shot_range=200))
+        cls.player.money -= 50
+        return True
 
     @classmethod
     def _mainmenu_btn_rect(cls):
@@ -228,6 +285,11 @@ class GameState:
         y = HEIGHT // 2 + 100
         return pygame.Rect(x, y, w, h)
 
+    @classmethod
+    def _mainmenu_endless_rect(cls):
+        w, h = 200, 44
+        return pygame.Rect(WIDTH // 2 - w // 2, HEIGHT // 2 + 340, w, h)
+
     @classmethod
     def _mainmenu_slider_rect(cls):
         # Slider bar area
@@ -247,13 +309,56 @@ class GameState:
     # ==============================================================
 
     @classmethod
-    def update(cls):
+    def tick(cls, inputs=None):
+        """
+        Advance the simulation by one fixed step (only gameplay simulates).
+        ``inputs`` is a PlayerInput; None polls the live keyboard and mouse.
+        """
+        if cls.current_state == STATE_GAME:
+            if inputs is None:
+                inputs = PlayerInput.poll()
+            if cls.recorder and not (cls.show_upgrades or cls.show_help):
+                cls.recorder.record(inputs)
+            cls._update_game(inputs)
+        elif cls.current_state == STATE_SLIDES:
+            cls._prepare_wave()
+
+    @classmethod
+    def note_frame(cls, ms):
+        """Report a frame's (headless: a tick's) work time for the endless load record."""
+        if cls.endless and cls.current_state == STATE_GAME and not (cls.show_upgrades or cls.show_help):
+            BudgetWatch.observe(ms, cls.wave_index + 1, len(cls.enemies))
+
+    @classmethod
+    def print_memory(cls):
+        """Debug: bytes per live entity, by type, to stdout."""
+        print("\n".join(memory_report(cls.player, cls.central_tower, cls.towers,
+                                      cls.enemies, cls.projectiles)))
+
+    @classmethod
+    def stop_recording(cls):
+        """Write out the current replay, if one is being recorded."""
+        rec, cls.recorder = cls.recorder, None
+        if rec is None or not rec.ticks:
+            return
+        path = os.path.join(REPLAY_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{rec.seed}.pfpr")
+        try:
+            rec.save(path)
+            print(f"Replay saved: {path}")
+        except OSError as e:
+            print(f"Replay not saved: {e}")
+
+    @classmethod
+    def draw(cls, alpha=1.0):
+        """Render the current state; ``alpha`` blends from the previous tick."""
+        if cls.current_state != STATE_GAME:
+            DirtyRects.invalidate()   # the game view starts from scratch again
         if cls.current_state == STATE_MAINMENU:
             cls._draw_mainmenu(); return
         if cls.current_state == STATE_SLIDES:
             cls._draw_slides(); return
         if cls.current_state == STATE_GAME:
-            cls._update_game(); cls._draw_game(); return
+            cls._draw_game(alpha); return
         if cls.current_state == STATE_VICTORY:
             cls._draw_slides(); return
         if cls.current_state == STATE_DEFEAT:
@@ -262,14 +367,11 @@ class GameState:
     @classmethod
     def _draw_mainmenu(cls):
         cls.screen.fill((20, 20, 40))
-        font_big = pygame.font.SysFont(None, 80, bold=True)
-        font = pygame.font.SysFont(None, 38)
-        font_small = pygame.font.SysFont(None, 28)
         # Title
-        title = font_big.render("Pray for Pointlessness", True, (255, 255, 120))
+        title = Text.render("Pray for Pointlessness", (255, 255, 120), 80, bold=True)
         cls.screen.blit(title, title.get_rect(center=(WIDTH//2, HEIGHT//2 - 160)))  # moved up
         # Subtitle
-        sub = font.render("Defend the Signal. Restore Roundness.", True, (180, 220, 255))
+        sub = Text.render("Defend the Signal. Restore Roundness.", (180, 220, 255), 38)
         cls.screen.blit(sub, sub.get_rect(center=(WIDTH//2, HEIGHT//2 - 100)))  # moved up
         # Difficulty slider
         slider_rect = cls._mainmenu_slider_rect()
@@ -284,22 +386,27 @@ class GameState:
         pygame.draw.circle(cls.screen, (255, 220, 80), (knob_x, bar_y), 16)
         # Slider label
         diff_txt = f"Difficulty: {cls.mainmenu_slider:.2f}x"
-        txt = font.render(diff_txt, True, (255,255,255))
+        txt = Text.render(diff_txt, (255,255,255), 38)
         cls.screen.blit(txt, (slider_rect.x, slider_rect.y - 54))  # more space above slider
         # Min/max
-        min_txt = font_small.render("Easy", True, (180,255,180))
-        max_txt = font_small.render("Hard", True, (255,180,180))
+        min_txt = Text.render("Easy", (180,255,180), 28)
+        max_txt = Text.render("Hard", (255,180,180), 28)
         cls.screen.blit(min_txt, (slider_rect.x-8, bar_y+28))  # more space below bar
         cls.screen.blit(max_txt, (slider_rect.x+slider_rect.width-60, bar_y+28))
         # Start button
         btn_rect = cls._mainmenu_btn_rect()
         btn_rect.y += 90  # move button further down (was 40)
         pygame.draw.rect(cls.screen, (80, 180, 80), btn_rect, border_radius=12)
-        btn_label = font.render("START", True, (255,255,255))
+        btn_label = Text.render("START", (255,255,255), 38)
         cls.screen.blit(btn_label, btn_label.get_rect(center=btn_rect.center))
         # Instructions
-        hint = font_small.render("Use the slider to set difficulty. Click START to play.", True, (200,200,200))
+        hint = Text.render("Use the slider to set difficulty. Click START to play, or ENDLESS to never stop.", (200,200,200), 28)
         cls.screen.blit(hint, hint.get_rect(center=(WIDTH//2, HEIGHT//2 + 300)))  # move hint further down
+        # Endless mode button
+        endless_rect = cls._mainmenu_endless_rect()
+        pygame.draw.rect(cls.screen, (150, 80, 180), endless_rect, border_radius=10)
+        endless_label = Text.render("ENDLESS", (255,255,255), 28)
+        cls.screen.blit(endless_label, endless_label.get_rect(center=endless_rect.center))
         pygame.display.flip()
 
     # --------------------------------------------------------------
@@ -320,6 +427,7 @@ class GameState:
         return img
 
     @staticmethod
+    @lru_cache(maxsize=16)   # fonts come from the Text registry, so they repeat
     def _wrap(text, font, max_w):
         lines, out = text.split("\n"), []
         for para in lines:
@@ -330,7 +438,7 @@ class GameState:
                     out.append(cur); cur = w
                 else: cur = test
             out.append(cur); out.append("")
-        return out
+        return tuple(out)
 
     @classmethod
     def _draw_slides(cls):
@@ -355,25 +463,24 @@ class GameState:
                 cls.screen.blit(img_scaled, img_rect)
 
         # Draw text on left half
-        font = pygame.font.SysFont(None, 40, bold=True)
+        font = Text.font(40, bold=True)
         y = 60
         for ln in cls._wrap(slide["text"], font, left_w - 40):
-            surf = font.render(ln, True, (255,255,255))
+            surf = Text.render(ln, (255,255,255), 40, bold=True)
             cls.screen.blit(surf, surf.get_rect(midleft=(30, y)))
             y += 36
 
         # Navigation hint
-        hint_font = pygame.font.SysFont(None, 32, bold=True)
         if cls.slide_index < len(slides) - 1:
-            hint = hint_font.render("SPACE to continue", True, (200,200,200))
+            hint = Text.render("SPACE to continue", (200,200,200), 32, bold=True)
         else:
             # End-of-slideshow hints
             if slides is VICTORY_SLIDES:
-                hint = hint_font.render("SPACE to finish", True, (200,255,200))
+                hint = Text.render("SPACE to finish", (200,255,200), 32, bold=True)
             elif slides is DEFEAT_SLIDES:
-                hint = hint_font.render("SPACE to finish", True, (255,120,120))
+                hint = Text.render("SPACE to finish", (255,120,120), 32, bold=True)
             else:
-                hint = hint_font.render("SPACE to continue", True, (200,200,200))
+                hint = Text.render("SPACE to continue", (200,200,200), 32, bold=True)
         cls.screen.blit(hint, hint.get_rect(bottomright=(WIDTH-30, HEIGHT-25)))
         pygame.display.flip()
 
@@ -381,15 +488,28 @@ class GameState:
     #                       GAME UPDATE
     # --------------------------------------------------------------
     @classmethod
-    def _update_game(cls):
+    def _update_game(cls, inputs=None):
+        # remember where everything was for render interpolation
+        cls.player.prev_x, cls.player.prev_y = cls.player.x, cls.player.y
+        for e in cls.enemies:
+            e.prev_x, e.prev_y = e.x, e.y
+        cls.projectiles.snapshot()
+
         if cls.show_upgrades or cls.show_help:
             return
+        prof = FrameProfiler
+        prof.start()
+        Clock.tick()   # runs the timed transitions due this tick
 
         # entities
-        cls.player.update(WIDTH, HEIGHT, cls.enemies, cls.projectiles)
-        cls.central_tower.update(cls.enemies, cls.projectiles)
-        for tw in cls.towers: tw.update(cls.enemies, cls.projectiles)
+        cls.player.update(WIDTH, HEIGHT, cls.enemies, cls.projectiles, inputs)
+        prof.lap("player")
+        cls.targeting.prepare([cls.central_tower, *cls.towers], cls.enemies)
+        cls.central_tower.update(cls.enemies, cls.projectiles, cls.targeting)
+        for tw in cls.towers: tw.update(cls.enemies, cls.projectiles, cls.targeting)
+        prof.lap("towers")
         cls.upgrade_manager.update_passives()
+        prof.lap("passives")
 
         # waves
         if cls.wave_running:
@@ -401,7 +521,7 @@ class GameState:
                 for e in cls.enemies:
                     e.health = 0
                 # Do not clear enemies here; let them be removed after all projectiles processed
-                wave = WAVES[cls.wave_index]
+                wave = wave_def(cls.wave_index)
                 cls.player.money += wave["reward"]
                 cls.wave_running = False
                 cls.wave_index  += 1
@@ -410,60 +530,96 @@ class GameState:
                     cls._launch_cutscene(MID_SLIDES_A); cls.mid_a_shown=True
                 elif cls.wave_index == 10 and not cls.mid_b_shown:
                     cls._launch_cutscene(MID_SLIDES_B); cls.mid_b_shown=True
-                elif cls.wave_index >= len(WAVES):
+                elif not cls._waves_left():
                     cls._launch_cutscene(VICTORY_SLIDES, victory=True)
-        elif cls.wave_index < len(WAVES):
+        elif cls._waves_left():
             cls._start_wave()
+        prof.lap("spawner")
 
         # enemy / projectile step
-        for e in cls.enemies:
-            e.update(cls.player, cls.towers, cls.central_tower,
-                     cls.projectiles, cls.enemies)
-        for p in cls.projectiles:
-            p.update(WIDTH, HEIGHT)
+        cls.enemy_grid.rebuild(cls.enemies)
+        cls.defender_index.rebuild(cls.player, cls.towers, cls.central_tower)
+        if cls.batch_kinematics_min is not None and len(cls.enemies) >= cls.batch_kinematics_min:
+            cls.kinematics.prepare(cls.enemies, cls.defender_index)
+            for e, step in zip(cls.enemies, cls.kinematics.steps):
+                e.update(cls.player, cls.towers, cls.central_tower,
+                         cls.projectiles, cls.enemies, cls.enemy_grid, step,
+                         cls.defender_index)
+        else:
+            for e in cls.enemies:
+                e.update(cls.player, cls.towers, cls.central_tower,
+                         cls.projectiles, cls.enemies, cls.enemy_grid,
+                         defenders=cls.defender_index)
+        prof.lap("enemies")
+        cls.projectiles.update(WIDTH, HEIGHT)
+        prof.lap("proj_update")
         cls._handle_projectiles()
+        prof.lap("collisions")
 
-        cls.projectiles[:] = [p for p in cls.projectiles if p.alive]
-        cls.enemies[:]     = [e for e in cls.enemies if e.health > 0]
-        cls.towers[:]      = [t for t in cls.towers if t.health > 0]
+        cls.projectiles.compact()
+        cls._compact(cls.enemies, release_enemy)
+        cls._compact(cls.towers)
+        prof.lap("compaction")
 
         if cls.player.health<=0 or cls.central_tower.health<=0:
             cls.slide_list  = DEFEAT_SLIDES
             cls.slide_index = 0
             cls.current_state = STATE_SLIDES
             MusicManager.set_mode(MusicMode.DEFEAT)
+            cls.stop_recording()
+
+    @staticmethod
+    def _compact(entities, release=None):
+        # drop the dead in place, keeping order (separation and targeting
+        # ties depend on it); the dead go to ``release`` for reuse
+        w = 0
+        for ent in entities:
+            if ent.health > 0:
+                entities[w] = ent; w += 1
+            elif release is not None:
+                release(ent)
+        del entities[w:]
 
     # -------------- spawner helpers --------------
     @classmethod
-    def _start_wave(cls):
-        cls.wave_running   = True
-        cls.step_index     = 0
-        cls.remaining_in_step = WAVES[cls.wave_index]["steps"][0]["count"]
-        cls.spawn_timer    = 0
-        cls.wave_timer     = 0  # Reset wave timer
+    def _waves_left(cls):
+        return cls.endless or cls.wave_index < len(WAVES)
+
+    @staticmethod
+    def _time_limit(wave_index):
         # Set wave_time_limit longer for later waves (base: 60s, +10s per wave)
         # Clamp to a reasonable max (e.g. 3 min)
         base = 3600  # 60s
         per_wave = 600  # 10s per wave
         max_limit = 10800  # 180s
-        cls.wave_time_limit = min(base + per_wave * cls.wave_index, max_limit)
+        return min(base + per_wave * wave_index, max_limit)
+
+    @classmethod
+    def _prepare_wave(cls):
+        # compile the next wave (and build its enemies) while nothing is simulating
+        if cls.next_timeline is None and not cls.wave_running and cls._waves_left():
+            cls.next_timeline = WaveTimeline(cls.wave_index, cls.difficulty, cls.rng,
+                                             cls._time_limit(cls.wave_index))
+
+    @classmethod
+    def _start_wave(cls):
+        cls.wave_running   = True
+        cls.wave_timer     = 0  # Reset wave timer
+        cls.wave_time_limit = cls._time_limit(cls.wave_index)
+        cls.timeline, cls.next_timeline = cls.next_timeline, None
+        if cls.timeline is None:
+            cls.timeline = WaveTimeline(cls.wave_index, cls.difficulty, cls.rng,
+                                        cls.wave_time_limit)
 
     @classmethod
     def _spawner_step(cls):
-        wave = WAVES[cls.wave_index]
-        if cls.step_index < len(wave["steps"]):
-            step = wave["steps"][cls.step_index]
-            if cls.remaining_in_step > 0:
-                cls.spawn_timer += 1
-                if cls.spawn_timer >= wave["spawn_rate"]:
-                    cls.spawn_timer = 0
-                    cls._spawn_enemy(step)
-            else:
-                cls.step_index += 1
-                if cls.step_index < len(wave["steps"]):
-                    cls.remaining_in_step = wave["steps"][cls.step_index]["count"]
+        wave = wave_def(cls.wave_index)
+        tl   = cls.timeline
+        if tl.spawning(cls.wave_timer):
+            cls.enemies.extend(tl.due(cls.wave_timer))
         else:
-            if not any(e.health>0 for e in cls.enemies):
+            # compaction at the end of every tick leaves only the living here
+            if not cls.enemies:
                 cls.player.money += wave["reward"]
                 cls.wave_running = False
                 cls.wave_index  += 1
@@ -472,71 +628,145 @@ class GameState:
                     cls._launch_cutscene(MID_SLIDES_A); cls.mid_a_shown=True
                 elif cls.wave_index == 10 and not cls.mid_b_shown:
                     cls._launch_cutscene(MID_SLIDES_B); cls.mid_b_shown=True
-                elif cls.wave_index >= len(WAVES):
+                elif not cls._waves_left():
                     cls._launch_cutscene(VICTORY_SLIDES, victory=True)
 
-    @classmethod
-    def _spawn_enemy(cls, step):
-        # Spawn enemies from all edges, not just the top
-        edge = random.choice(['top', 'bottom', 'left', 'right'])
-        if edge == 'top':
-            x = random.randint(0, WIDTH)
-            y = 0
-        elif edge == 'bottom':
-            x = random.randint(0, WIDTH)
-            y = HEIGHT
-        elif edge == 'left':
-            x = 0
-            y = random.randint(0, HEIGHT)
-        else:  # right
-            x = WIDTH
-            y = random.randint(0, HEIGHT)
-        cls.enemies.append(
-            spawn_enemy(step["type"], step["tier"], x, y)
-        )
-        cls.remaining_in_step -= 1
-
     @classmethod
     def _launch_cutscene(cls, slides, *, victory=False):
         cls.slide_list  = slides
         cls.slide_index = 0
         cls.current_state = STATE_SLIDES
         MusicManager.set_mode(MusicMode.VICTORY if victory else MusicMode.MENU)
+        if victory:
+            cls.stop_recording()
 
     # -------------- collisions --------------
+    @classmethod
+    def _build_hit_grids(cls):
+        eg = cls.enemy_hits
+        eg.clear()
+        for e in cls.enemies:
+            if e.health > 0:
+                h = e.size/2
+                eg.add(e, e.x+h, e.y+h, h)
+        # dead towers keep absorbing shots until they are culled this frame
+        dg = cls.defender_hits
+        dg.clear()
+        for tw in cls.towers:
+            dg.add(tw, tw.x, tw.y, tw.radius)
+        ct = cls.central_tower
+        dg.add(ct, ct.x, ct.y, ct.radius)
+
     @classmethod
     def _handle_projectiles(cls):
-        for p in cls.projectiles:
-            if not p.alive: continue
-            if p.is_friendly:
-                for e in cls.enemies:
-                    if e.health<=0: continue
-                    ex,ey = e.center()
-                    if math.hypot(ex-p.x, ey-p.y) < (e.size/2+p.radius):
-                        e.take_damage(p.damage); p.alive=False
-                        if e.health<=0: cls.player.money += e.kill_reward
-                        break
-            else:
-                if math.hypot(cls.player.x-p.x, cls.player.y-p.y) < (cls.player.radius+p.radius):
-                    cls.player.take_damage(p.damage); p.alive=False; continue
-                for tw in cls.towers+[cls.central_tower]:
-                    if math.hypot(tw.x-p.x, tw.y-p.y) < (tw.radius+p.radius):
-                        tw.take_damage(p.damage); p.alive=False; break
+        cls._build_hit_grids()
+        eg, dg, ps = cls.enemy_hits, cls.defender_hits, cls.projectiles
+        n = ps.n
+        if not n: return
+        xs, ys, live = ps.x[:n], ps.y[:n], ps.alive[:n]
+        pad = float(ps.radius[:n].max())
+        # friendly and hostile shots touch disjoint targets, so each faction
+        # can be resolved on its own; only shots near a body reach the loop
+        friendly = live & ps.friendly[:n]
+        hostile  = live & ~ps.friendly[:n]
+        cand_f = np.flatnonzero(friendly & eg.cover_mask(xs, ys, pad))
+        cand_h = np.flatnonzero(hostile)
+        pl = cls.player
+        for j in cand_f.tolist():
+            px, py, pr = float(xs[j]), float(ys[j]), float(ps.radius[j])
+            for i in eg.query(px, py, pr):
+                e = eg.bodies[i]
+                if e.health<=0: continue
+                if math.hypot(eg.cx[i]-px, eg.cy[i]-py) < (eg.r[i]+pr):
+                    e.take_damage(float(ps.damage[j])); live[j]=False
+                    if e.health<=0: pl.money += e.kill_reward
+                    break
+        if not len(cand_h): return
+        hx, hy = xs[cand_h], ys[cand_h]
+        near = dg.cover_mask(hx, hy, pad) | (np.hypot(hx-pl.x, hy-pl.y) <= pl.radius+pad+1)
+        for j in cand_h[near].tolist():
+            px, py, pr = float(xs[j]), float(ys[j]), float(ps.radius[j])
+            if math.hypot(pl.x-px, pl.y-py) < (pl.radius+pr):
+                pl.take_damage(float(ps.damage[j])); live[j]=False; continue
+            for i in dg.query(px, py, pr):
+                if math.hypot(dg.cx[i]-px, dg.cy[i]-py) < (dg.r[i]+pr):
+                    dg.bodies[i].take_damage(float(ps.damage[j])); live[j]=False; break
 
     # -------------- draw --------------
+    @staticmethod
+    def _draw_lerped(ent, surf, alpha):
+        # draw at the position blended between the last two ticks
+        x, y = ent.x, ent.y
+        ent.x = ent.prev_x + (x - ent.prev_x)*alpha
+        ent.y = ent.prev_y + (y - ent.prev_y)*alpha
+        rect = ent.draw(surf)
+        ent.x, ent.y = x, y
+        return rect
+
+    @classmethod
+    def _draw_floor(cls, surf):
+        # the game view's background; in dirty-rect mode it carries the range circles
+        surf.fill((30,30,30))
+        if cls.dirty_rects:
+            cls.central_tower.draw_range(surf)
+            for tw in cls.towers: tw.draw_range(surf)
+
     @classmethod
-    def _draw_game(cls):
-        cls.screen.fill((30,30,30))
-        cls.central_tower.draw(cls.screen)
-        for tw in cls.towers: tw.draw(cls.screen)
-        for e  in cls.enemies: e.draw(cls.screen)
-        for p  in cls.projectiles: p.draw(cls.screen)
-        cls.player.draw(cls.screen)
-
-        font = pygame.font.SysFont(None, 30)
-        ctrl_font = pygame.font.SysFont(None, 26)
+    def _draw_towers(cls, surf, dirty):
+        towers = (cls.central_tower, *cls.towers)
+        if not dirty:
+            return [tw.draw(surf) for tw in towers]
+        # the background has every range circle under every tower, but a full
+        # repaint draws each circle just before its own tower, over the ones
+        # drawn earlier: redraw it where it crosses those
+        rects = []
+        for tw in towers:
+            if tw.health > 0 and rects:
+                rng  = tw.shot_range
+                ring = pygame.Rect(int(tw.x) - rng - 1, int(tw.y) - rng - 1, 2*rng + 3, 2*rng + 3)
+                for k in ring.collidelistall(rects):
+                    surf.set_clip(rects[k])
+                    tw.draw_range(surf)
+                surf.set_clip(None)
+            r = tw.draw(surf, False)
+            if r: rects.append(r)
+        return rects
+
+    @classmethod
+    def _draw_game(cls, alpha=1.0):
+        prof = FrameProfiler
+        prof.start()
+        scr, dirty = cls.screen, cls.dirty_rects
+        if dirty:
+            ranges = tuple((t.x, t.y, t.shot_range) for t in (cls.central_tower, *cls.towers) if t.health > 0)
+            DirtyRects.begin(scr, ranges, cls._draw_floor)
+        else:
+            cls._draw_floor(scr)
+        rects = cls._draw_towers(scr, dirty)
+        rects += [cls._draw_lerped(e, scr, alpha) for e in cls.enemies]
+        rects += cls.projectiles.draw(scr, alpha)
+        rects.append(cls._draw_lerped(cls.player, scr, alpha))
+        prof.lap("draw_world")
+        rects += cls._draw_hud()
+        prof.lap("draw_hud")
+
+        if cls.show_upgrades:
+            rects.append(cls.upgrade_menu.draw_menu(scr, cls.player))
+        if cls.show_help:
+            rects.append(draw_instructions(scr))
+        rects.append(prof.draw(scr, len(cls.enemies), len(cls.projectiles), len(cls.towers)))
+        prof.lap("draw_ui")
+
+        if dirty:
+            DirtyRects.end(scr, rects)
+        else:
+            pygame.display.flip()
+        prof.lap("flip")
+
+    @classmethod
+    def _draw_hud(cls):
         ctrl_txt = "T: Tower   U: Upgrade   H: Help"
-        cls.screen.blit(ctrl_font.render(ctrl_txt, True, (180,255,180)), (20, 0))
+        rects = [cls.screen.blit(Text.render(ctrl_txt, (180,255,180), 26), (20, 0))]
 
         if cls.wave_index >= len(WAVES):
             if len(cls.enemies) == 0:
@@ -551,11 +781,10 @@ class GameState:
         hud  = (f"Signal Strength {signal_strength:.3%}    "
             f"HP {int(cls.player.health)}/{cls.player.max_health}    "
             f"Roundness Points {int(cls.player.money)}")
-        cls.screen.blit(font.render(hud, True, (255,255,255)), (20,20))
-
-        if cls.show_upgrades:
-            cls.upgrade_menu.draw_menu(cls.screen, cls.player)
-        if cls.show_help:
-            draw_instructions(cls.screen)
-
-        pygame.display.flip()
+        rects.append(cls.screen.blit(Text.render(hud, (255,255,255), 30), (20,20)))
+        if cls.endless and cls.wave_index >= len(WAVES):
+            endless = f"Endless wave {cls.wave_index + 1}"
+            if BudgetWatch.record:
+                endless += f"    over frame budget since wave {BudgetWatch.record[0]}"
+            rects.append(cls.screen.blit(Text.render(endless, (220,160,255), 30), (20,46)))
+        return rects
@@ -0,0 +1,179 @@
+"""
+Balance sweep: many headless games in parallel across difficulty levels and
+scripted player strategies.
+
+Each worker plays one (strategy, difficulty, seed) game and sends back only a
+small summary (wave reached, outcome and a few sampled curves), never game
+state. The parent averages the runs of each configuration.
+
+    python sweep.py --seeds 8 --steps 7 --strategies turret builder
+    python sweep.py --json sweep.json
+"""
+
+import argparse, json, math, os, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config   import WIDTH, HEIGHT, PLAYER_TOWER_COST
+from player   import PlayerInput
+from upgrades import UpgradeType
+from waves    import WAVES
+
+SAMPLE_EVERY = 600   # ticks between curve samples (10 s of game time)
+
+
+# ──────────────────────────────────────────────────────────
+#   scripted strategies: game -> PlayerInput
+# ──────────────────────────────────────────────────────────
+def _nearest_enemy(st):
+    p, best, bd = st.player, None, float('inf')
+    for e in st.enemies:
+        if e.health > 0:
+            d = math.hypot(e.x - p.x, e.y - p.y)
+            if d < bd:
+                best, bd = e, d
+    return best
+
+def _shoot_from(st, hold_x, hold_y, **actions):
+    """Walk towards (hold_x, hold_y) and fire at the nearest enemy."""
+    p = st.player
+    tgt = _nearest_enemy(st)
+    aim = (int(tgt.x + tgt.size/2), int(tgt.y + tgt.size/2)) if tgt else (int(p.x), int(p.y) - 1)
+    slack = p.speed
+    return PlayerInput(left=p.x > hold_x + slack, right=p.x < hold_x - slack,
+                       up=p.y > hold_y + slack, down=p.y < hold_y - slack,
+                       fire=tgt is not None, aim=aim, **actions)
+
+def idle(game):
+    return PlayerInput()
+
+def turret(game):
+    """Stand just below the central tower and shoot."""
+    st = game.state
+    return _shoot_from(st, st.central_tower.x, st.central_tower.y + 110)
+
+_RING = [(WIDTH//2 + int(220*math.cos(a)), HEIGHT//2 + int(220*math.sin(a)))
+         for a in [k*math.pi/4 for k in range(8)]]
+
+def builder(game):
+    """Ring the central tower with towers, then pour money into tower upgrades."""
+    st = game.state
+    n = len(st.towers)
+    if n < len(_RING):
+        hx, hy = _RING[n]
+        here = math.hypot(st.player.x - hx, st.player.y - hy) <= st.player.speed*2
+        return _shoot_from(st, hx, hy,
+                           place_tower=here and st.player.money >= PLAYER_TOWER_COST)
+    buy = (UpgradeType.TOWER_ATTACK, UpgradeType.TOWER_DEFENSE)[game.ticks // 600 % 2]
+    return _shoot_from(st, st.central_tower.x, st.central_tower.y + 110, buy=(buy,))
+
+_UPGRADE_CYCLE = [UpgradeType.PLAYER_ATTACK_DAMAGE, UpgradeType.CENTRAL_ATTACK,
+                  UpgradeType.CENTRAL_DEFENSE, UpgradeType.PLAYER_ATTACK_SPEED,
+                  UpgradeType.CENTRAL_REGEN, UpgradeType.PLAYER_HEALTH]
+
+def upgrader(game):
+    """No towers; buy player and central-tower upgrades round-robin."""
+    st = game.state
+    want = _UPGRADE_CYCLE[sum(st.upgrade_manager.levels.values()) % len(_UPGRADE_CYCLE)]
+    return _shoot_from(st, st.central_tower.x, st.central_tower.y + 110, buy=(want,))
+
+STRATEGIES = {"idle": idle, "turret": turret, "builder": builder, "upgrader": upgrader}
+
+
+# ──────────────────────────────────────────────────────────
+#   worker
+# ──────────────────────────────────────────────────────────
+def run_one(strategy, difficulty, seed, max_ticks):
+    from headless import HeadlessGame
+    game   = HeadlessGame(difficulty, seed=seed)
+    policy = STRATEGIES[strategy]
+    st     = game.state
+    curves = {"central_hp": [], "tower_hp": [], "towers": [], "money": [], "wave": []}
+    while game.ticks < max_ticks:
+        if game.ticks % SAMPLE_EVERY == 0:
+            curves["central_hp"].append(st.central_tower.health)
+            curves["tower_hp"].append(sum(t.health for t in st.towers))
+            curves["towers"].append(len(st.towers))
+            curves["money"].append(st.player.money)
+            curves["wave"].append(st.wave_index + 1)
+        if not game.step(policy(game)):
+            break
+    return {"strategy": strategy, "difficulty": difficulty, "seed": seed,
+            "wave": min(st.wave_index + 1, len(WAVES)),
+            "victory": game.victory, "ticks": game.ticks, "curves": curves}
+
+
+# ──────────────────────────────────────────────────────────
+#   aggregation
+# ──────────────────────────────────────────────────────────
+def _mean_curve(runs):
+    # runs end at different times; average over the runs still alive
+    length = max(len(c) for c in runs)
+    out = []
+    for i in range(length):
+        vals = [c[i] for c in runs if i < len(c)]
+        out.append(round(sum(vals) / len(vals), 2))
+    return out
+
+def aggregate(results):
+    groups = {}
+    for r in results:
+        groups.setdefault((r["strategy"], r["difficulty"]), []).append(r)
+    table = []
+    for (strategy, diff), runs in sorted(groups.items()):
+        waves = sorted(r["wave"] for r in runs)
+        table.append({
+            "strategy":    strategy,
+            "difficulty":  diff,
+            "runs":        len(runs),
+            "mean_wave":   round(sum(waves) / len(waves), 2),
+            "median_wave": waves[len(waves)//2],
+            "victories":   sum(r["victory"] for r in runs),
+            "curves": {k: _mean_curve([r["curves"][k] for r in runs])
+                       for k in runs[0]["curves"]},
+        })
+    return table
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Sweep difficulty x strategy with headless games.")
+    ap.add_argument("--strategies", nargs="+", default=["turret", "builder", "upgrader"],
+                    choices=sorted(STRATEGIES))
+    ap.add_argument("--min", type=float, default=0.5, help="lowest difficulty")
+    ap.add_argument("--max", type=float, default=2.0, help="highest difficulty")
+    ap.add_argument("--steps", type=int, default=7, help="difficulty levels in the range")
+    ap.add_argument("--seeds", type=int, default=4, help="games per configuration")
+    ap.add_argument("--max-ticks", type=int, default=150000)
+    ap.add_argument("--workers", type=int, default=None, help="default: one per core")
+    ap.add_argument("--json", help="write the aggregated table and curves here")
+    args = ap.parse_args()
+
+    n = max(1, args.steps)
+    diffs = [round(args.min + (args.max - args.min) * k / max(1, n - 1), 2) for k in range(n)]
+    jobs  = [(s, d, seed, args.max_ticks)
+             for s in args.strategies for d in diffs for seed in range(args.seeds)]
+
+    t0, results = time.perf_counter(), []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(run_one, *job) for job in jobs]
+        for k, fut in enumerate(as_completed(futures), 1):
+            results.append(fut.result())
+            print(f"\r{k}/{len(jobs)} games", end="", flush=True)
+    print(f"\r{len(jobs)} games in {time.perf_counter() - t0:.1f}s")
+
+    table = aggregate(results)
+    print(f"{'strategy':<10} {'diff':>5} {'runs':>5} {'wave':>6} {'med':>4} {'wins':>5} "
+          f"{'end central HP':>15} {'end money':>10}")
+    for row in table:
+        c = row["curves"]
+        print(f"{row['strategy']:<10} {row['difficulty']:>5.2f} {row['runs']:>5} "
+              f"{row['mean_wave']:>6.2f} {row['median_wave']:>4} {row['victories']:>5} "
+              f"{c['central_hp'][-1]:>15.1f} {c['money'][-1]:>10.1f}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"sample_every": SAMPLE_EVERY, "configs": table}, f, indent=1)
+        print(f"wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import numpy as np
+from timers import Clock
+
+class TowerTargeting:
+    """
+    Once-per-frame target selection for every tower whose shot is ready.
+
+    Distances from the ready towers to all live enemies come from one
+    towers x enemies matrix. The few enemies tied for nearest (within float
+    noise) are then handed to the tower's own ``find_nearest_enemy`` so the
+    pick is exactly the one its linear scan would make.
+    """
+    EPS = 1e-6
+
+    def __init__(self):
+        self.targets = {}
+
+    def prepare(self, towers, enemies):
+        self.targets.clear()
+        now   = Clock.now
+        ready = [t for t in towers if t.health > 0 and t.shot_ready <= now]
+        if not ready: return
+        live = [e for e in enemies if e.health > 0]
+        if not live: return
+
+        ex  = np.array([e.x for e in live], float)
+        ey  = np.array([e.y for e in live], float)
+        tx  = np.array([t.x for t in ready], float)
+        ty  = np.array([t.y for t in ready], float)
+        rng = np.array([t.shot_range for t in ready], float)
+
+        d = np.hypot(ex[None, :] - tx[:, None], ey[None, :] - ty[:, None])
+        d[d >= rng[:, None] + self.EPS] = np.inf
+        best = d.min(axis=1)
+        for row, t in enumerate(ready):
+            if best[row] == np.inf: continue
+            near = np.flatnonzero(d[row] <= best[row] + self.EPS)
+            self.targets[id(t)] = t.find_nearest_enemy([live[k] for k in near])
+
+    def pick(self, tower):
+        return self.targets.get(id(tower))
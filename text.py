@@ -0,0 +1,50 @@
+from collections import OrderedDict
+import pygame
+
+from config import TEXT_CACHE_BYTES
+
+
+class Text:
+    """
+    Shared fonts and rendered strings for the HUD, menus and overlays.
+
+    ``font`` opens each (size, bold, file) once; the default is the
+    ``SysFont(None, ...)`` every screen used. ``render`` hands back the
+    surface for a (font, text, colour), keeping the most recently used ones
+    up to ``TEXT_CACHE_BYTES`` of pixels, so a label that did not change
+    costs a blit. The surfaces are shared: blit them, never draw on them.
+    """
+    fonts = {}              # (size, bold, path) -> Font
+    cache = OrderedDict()   # (font key, text, colour) -> Surface, least recent first
+    used  = 0               # pixel bytes held by cache
+
+    @classmethod
+    def font(cls, size, bold=False, path=None):
+        key = (size, bold, path)
+        f = cls.fonts.get(key)
+        if f is None:
+            if path is None:
+                f = pygame.font.SysFont(None, size, bold=bold)
+            else:
+                f = pygame.font.Font(path, size)
+                f.set_bold(bold)
+            cls.fonts[key] = f
+        return f
+
+    @classmethod
+    def render(cls, text, color, size, bold=False, path=None):
+        """Anti-aliased ``text`` in ``color``, from the cache when possible."""
+        key = ((size, bold, path), text, color)
+        surf = cls.cache.get(key)
+        if surf is not None:
+            cls.cache.move_to_end(key)
+            return surf
+        surf = cls.font(size, bold, path).render(text, True, color)
+        if TEXT_CACHE_BYTES is None:
+            return surf
+        cls.cache[key] = surf
+        cls.used += surf.get_pitch() * surf.get_height()
+        while cls.used > TEXT_CACHE_BYTES and len(cls.cache) > 1:
+            _, old = cls.cache.popitem(last=False)
+            cls.used -= old.get_pitch() * old.get_height()
+        return surf
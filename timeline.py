@@ -0,0 +1,82 @@
+from functools import lru_cache
+
+from config import WIDTH, HEIGHT
+from waves  import wave_def
+from enemy  import spawn_enemy, release_enemy
+
+
+@lru_cache(maxsize=32)
+def wave_schedule(wave_index, until=None):
+    """
+    ``wave_def(wave_index)`` flattened to ``(entries, end)``: entries are
+    ``(tick, type, tier)`` in spawn order, ticks counted like the wave
+    timer (1 on the first tick after the wave starts). Each step spawns one
+    enemy every ``spawn_rate`` ticks and the next step starts one tick
+    after; ``end`` is the tick the last step finishes on. Entries after
+    tick ``until`` are left out (endless waves grow without bound).
+    """
+    wave  = wave_def(wave_index)
+    rate  = max(1, wave["spawn_rate"])
+    entries, base = [], 0
+    for step in wave["steps"]:
+        count = step["count"]
+        if until is not None:
+            count = max(0, min(count, (until - base) // rate))
+        for j in range(1, count + 1):
+            entries.append((base + j * rate, step["type"], step["tier"]))
+        base += step["count"] * rate + 1
+    return tuple(entries), base
+
+
+def spawn_point(rng):
+    # Spawn enemies from all edges, not just the top
+    edge = rng.choice(['top', 'bottom', 'left', 'right'])
+    if edge == 'top':
+        return rng.randint(0, WIDTH), 0
+    elif edge == 'bottom':
+        return rng.randint(0, WIDTH), HEIGHT
+    elif edge == 'left':
+        return 0, rng.randint(0, HEIGHT)
+    else:  # right
+        return WIDTH, rng.randint(0, HEIGHT)
+
+
+class WaveTimeline:
+    """
+    One wave compiled for a run: the cached schedule plus a ready-built
+    enemy (at its spawn point) per entry; ``due(tick)`` hands them out in order.
+
+    Spawns are the only users of the gameplay rng, so drawing every point
+    and colour up front, in spawn order, leaves the stream as it was.
+    Entries after ``time_limit + 1`` are never scheduled, because the wave
+    is cut off before they would spawn.
+    """
+    __slots__ = ("ticks", "enemies", "end", "cursor")
+
+    def __init__(self, wave_index, difficulty, rng, time_limit):
+        entries, self.end = wave_schedule(wave_index, time_limit + 1)
+        self.ticks, self.enemies = [], []
+        for tick, kind, tier in entries:
+            x, y = spawn_point(rng)
+            self.ticks.append(tick)
+            self.enemies.append(spawn_enemy(kind, tier, x, y, difficulty, rng))
+        self.cursor = 0
+
+    def due(self, tick):
+        """Enemies whose spawn tick has come, advancing the cursor past them."""
+        i = j = self.cursor
+        ticks = self.ticks
+        while j < len(ticks) and ticks[j] <= tick:
+            j += 1
+        self.cursor = j
+        return self.enemies[i:j]
+
+    def spawning(self, tick):
+        """True until the tick after the last step has finished."""
+        return tick <= self.end
+
+    def discard(self):
+        """Return the enemies that never spawned to the pool."""
+        for e in self.enemies[self.cursor:]:
+            release_enemy(e)
+        del self.enemies[self.cursor:]
@@ -0,0 +1,85 @@
+class TimingWheel:
+    """
+    Hierarchical timing wheel keyed by simulation tick.
+
+    ``schedule(tick, fn, *args)`` files an event in the coarsest level whose
+    span still reaches it (64 slots per level, each level 64x coarser than
+    the one below). Every ``advance`` tick empties one level-0 slot, and
+    when a level rolls over the next level's slot is re-filed one level
+    down. The cost of a tick is the number of events due, not the number
+    pending.
+    """
+    BITS   = 6
+    SLOTS  = 1 << BITS
+    LEVELS = 4   # direct reach 64**4 ticks (~78 h at 60 Hz), then overflow
+
+    def __init__(self, now=0):
+        self.now      = now
+        self.levels   = [[[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self.overflow = []
+
+    def schedule(self, tick, fn, *args):
+        """Call ``fn(*args)`` when the wheel reaches ``tick`` (next tick if already past); returns a handle."""
+        ev = [max(tick, self.now + 1), fn, args]
+        self._file(ev)
+        return ev
+
+    @staticmethod
+    def cancel(ev):
+        ev[1] = None
+
+    def _file(self, ev):
+        delta = ev[0] - self.now
+        for lvl in range(self.LEVELS):
+            if delta < 1 << (self.BITS * (lvl + 1)):
+                self.levels[lvl][(ev[0] >> (self.BITS * lvl)) & (self.SLOTS - 1)].append(ev)
+                return
+        self.overflow.append(ev)
+
+    def advance(self, tick):
+        """Move to ``tick``, firing everything due on the way, in filing order."""
+        bits, mask = self.BITS, self.SLOTS - 1
+        while self.now < tick:
+            self.now = t = self.now + 1
+            # cascade the coarser slots that start at this tick
+            for lvl in range(1, self.LEVELS + 1):
+                if t & ((1 << (bits * lvl)) - 1):
+                    break
+                if lvl == self.LEVELS:
+                    pending, self.overflow = self.overflow, []
+                else:
+                    slots = self.levels[lvl]
+                    idx = (t >> (bits * lvl)) & mask
+                    pending, slots[idx] = slots[idx], []
+                for ev in pending:
+                    self._file(ev)
+            bucket = self.levels[0][t & mask]
+            if bucket:
+                self.levels[0][t & mask] = []
+                for ev in bucket:
+                    if ev[1] is not None:
+                        ev[1](*ev[2])
+
+
+class Clock:
+    """
+    The simulation clock: ticks advanced by the game loop (paused ticks do
+    not count) and the wheel entities schedule timed transitions on.
+    Cooldowns are kept as the tick they end on and compared with ``now``.
+    """
+    now   = 0
+    wheel = TimingWheel()
+
+    @classmethod
+    def reset(cls):
+        cls.now   = 0
+        cls.wheel = TimingWheel()
+
+    @classmethod
+    def tick(cls):
+        cls.now += 1
+        cls.wheel.advance(cls.now)
+
+    @classmethod
+    def after(cls, ticks, fn, *args):
+        return cls.wheel.schedule(cls.now + ticks, fn, *args)
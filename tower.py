@@ -1,12 +1,17 @@
 import pygame
 import math
 from typing import List
-from projectile import Projectile
 from enemy import BaseEnemy
 from utils import draw_health_bar
 from music_manager import MusicManager
+from timers import Clock
 
 class CentralTower:
+    __slots__ = ("x", "y", "radius", "max_health", "health",
+                 "shot_cooldown", "shot_ready", "shot_speed", "shot_damage", "shot_range",
+                 "firing_until", "firing_flash_duration",
+                 "damage_flash_duration", "damage_flash_until")
+
     def __init__(self, x, y,
                  max_health=200, radius=40,
                  shot_cooldown=32, shot_speed=5,  
@@ -18,32 +23,25 @@ class CentralTower:
         self.health = max_health
 
         self.shot_cooldown = shot_cooldown
-        self.shot_timer = 0
+        self.shot_ready = 0   # Clock tick the next shot is allowed on
         self.shot_speed = shot_speed
         self.shot_damage = shot_damage
         self.shot_range = shot_range
 
-        self.firing = False
-        self.firing_timer = 0
+        self.firing_until = 0
         self.firing_flash_duration=5
 
         self.damage_flash_duration=20
-        self.damage_flash_timer=0
+        self.damage_flash_until=0
 
-    def update(self, enemies, projectiles):
+    def update(self, enemies, projectiles, targeting=None):
         if self.health<=0:
             return
-        if self.shot_timer>0:
-            self.shot_timer-=1
-        if self.firing:
-            self.firing_timer-=1
-            if self.firing_timer<=0:
-                self.firing=False
-        if self.damage_flash_timer>0:
-            self.damage_flash_timer-=1
-
-        if self.shot_timer<=0:
-            tgt=self.find_nearest_enemy(enemies)
+        if Clock.now >= self.shot_ready:
+            if targeting is not None:
+                tgt=targeting.pick(self)
+            else:
+                tgt=self.find_nearest_enemy(enemies)
             if tgt:
                 dx,dy= tgt.x-self.x, tgt.y-self.y
                 dist=math.hypot(dx,dy)
@@ -52,13 +50,11 @@ class CentralTower:
                     # Spawn projectile slightly outside the tower's radius
                     px = self.x + dirx * (self.radius + 8)
                     py = self.y + diry * (self.radius + 8)
-                    proj= Projectile(px, py, dirx, diry,
-                                     speed=self.shot_speed, damage=self.shot_damage,
-                                     is_friendly=True)
-                    projectiles.append(proj)
-                    self.shot_timer=self.shot_cooldown
-                    self.firing=True
-                    self.firing_timer=self.firing_flash_duration
+                    projectiles.spawn(px, py, dirx, diry,
+                                      speed=self.shot_speed, damage=self.shot_damage,
+                                      is_friendly=True)
+                    self.shot_ready=Clock.now+self.shot_cooldown
+                    self.firing_until=Clock.now+self.firing_flash_duration
                     MusicManager.play_sfx("laser.ogg")
 
     def find_nearest_enemy(self, enemies):
@@ -72,35 +68,52 @@ class CentralTower:
                     best=e
         return best
 
+    @property
+    def firing(self):
+        return Clock.now < self.firing_until
+
+    @property
+    def damage_flash_timer(self):
+        return max(0, self.damage_flash_until - Clock.now)
+
     def take_damage(self,dmg):
         self.health-=dmg
         if self.health<0:
             self.health=0
-        self.damage_flash_timer=self.damage_flash_duration
+        self.damage_flash_until=Clock.now+self.damage_flash_duration
         MusicManager.play_sfx("break.ogg")  # <-- play break sound
 
-    def draw(self,surface):
+    def draw_range(self, surface):
         if self.health<=0: return
         # Draw range indicator
-        pygame.draw.circle(
+        return pygame.draw.circle(
             surface,
             (180,180,180),
             (int(self.x), int(self.y)),
             self.shot_range,
             1
         )
+
+    def draw(self,surface,show_range=True):
+        if self.health<=0: return
+        if show_range: self.draw_range(surface)
         color=(255,0,0) if self.damage_flash_timer>0 else (100,100,255)
         if self.firing:
             color=(200,200,100)
-        pygame.draw.circle(surface,color,(int(self.x),int(self.y)),self.radius)
+        body = pygame.draw.circle(surface,color,(int(self.x),int(self.y)),self.radius)
         # Health bar
         bar_width = self.radius * 2
         bar_height = 10
         bar_x = int(self.x - self.radius)
         bar_y = int(self.y - self.radius - 20)
-        draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health))
 
 class PlayerTower:
+    __slots__ = ("x", "y", "radius", "max_health", "health",
+                 "shot_cooldown", "shot_ready", "shot_speed", "shot_damage", "shot_range",
+                 "firing_until", "firing_flash_duration",
+                 "damage_flash_duration", "damage_flash_until", "regen_rate")
+
     def __init__(self, x, y,
                  max_health=80, radius=20,
                  shot_cooldown=32, shot_speed=5,  # buffed: cooldown from 40→32
@@ -112,37 +125,30 @@ class PlayerTower:
         self.health = max_health
 
         self.shot_cooldown= shot_cooldown
-        self.shot_timer=0
+        self.shot_ready=0
         self.shot_speed= shot_speed
         self.shot_damage= shot_damage
         self.shot_range= shot_range
 
-        self.firing=False
-        self.firing_timer=0
+        self.firing_until=0
         self.firing_flash_duration=5
 
         self.damage_flash_duration=20
-        self.damage_flash_timer=0
+        self.damage_flash_until=0
 
         self.regen_rate = 0.05 
 
-    def update(self, enemies, projectiles):
+    def update(self, enemies, projectiles, targeting=None):
         if self.health<=0:
             return
         # Regenerate health if not at max
         if self.health < self.max_health:
             self.health = min(self.max_health, self.health + self.regen_rate)
-        if self.shot_timer>0:
-            self.shot_timer-=1
-        if self.firing:
-            self.firing_timer-=1
-            if self.firing_timer<=0:
-                self.firing=False
-        if self.damage_flash_timer>0:
-            self.damage_flash_timer-=1
-
-        if self.shot_timer<=0:
-            tgt=self.find_nearest_enemy(enemies)
+        if Clock.now >= self.shot_ready:
+            if targeting is not None:
+                tgt=targeting.pick(self)
+            else:
+                tgt=self.find_nearest_enemy(enemies)
             if tgt:
                 dx,dy= tgt.x-self.x, tgt.y-self.y
                 dist=math.hypot(dx,dy)
@@ -150,17 +156,15 @@ class PlayerTower:
                     dirx,diry=dx/dist,dy/dist
                     px = self.x - dirx * (self.radius + 6)
                     py = self.y - diry * (self.radius + 6)
-                    proj= Projectile(
+                    projectiles.spawn(
                         x=px, y=py,
                         dx=dirx, dy=diry,
                         speed=self.shot_speed,
                         damage=self.shot_damage,
                         is_friendly=True
                     )
-                    projectiles.append(proj)
-                    self.shot_timer=self.shot_cooldown
-                    self.firing=True
-                    self.firing_timer=self.firing_flash_duration
+                    self.shot_ready=Clock.now+self.shot_cooldown
+                    self.firing_until=Clock.now+self.firing_flash_duration
                     MusicManager.play_sfx("laser.ogg")
 
     def find_nearest_enemy(self,enemies):
@@ -174,29 +178,41 @@ class PlayerTower:
                     best=e
         return best
 
+    @property
+    def firing(self):
+        return Clock.now < self.firing_until
+
+    @property
+    def damage_flash_timer(self):
+        return max(0, self.damage_flash_until - Clock.now)
+
     def take_damage(self, dmg):
         self.health-=dmg
         if self.health<0:
             self.health=0
-        self.damage_flash_timer=self.damage_flash_duration
+        self.damage_flash_until=Clock.now+self.damage_flash_duration
 
-    def draw(self,surface):
+    def draw_range(self, surface):
         if self.health<=0: return
         # Draw range indicator
-        pygame.draw.circle(
+        return pygame.draw.circle(
             surface,
             (180,180,180),
             (int(self.x), int(self.y)),
             self.shot_range,
             1
         )
+
+    def draw(self,surface,show_range=True):
+        if self.health<=0: return
+        if show_range: self.draw_range(surface)
         color=(255,0,0) if self.damage_flash_timer>0 else (100,200,100)
         if self.firing:
             color=(200,200,100)
-        pygame.draw.circle(surface,color,(int(self.x),int(self.y)),self.radius)
+        body = pygame.draw.circle(surface,color,(int(self.x),int(self.y)),self.radius)
         # Health bar
         bar_width = self.radius * 2
         bar_height = 8
         bar_x = int(self.x - self.radius)
         bar_y = int(self.y - self.radius - 16)
-        draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health)
+        return body.union(draw_health_bar(surface, bar_x, bar_y, bar_width, bar_height, self.health, self.max_health))
@@ -1,6 +1,7 @@
 import pygame
 from enum import Enum
 from config import WIDTH, HEIGHT
+from text import Text
 
 class UpgradeType(Enum):
     PLAYER_ATTACK_DAMAGE = 1
@@ -106,6 +107,14 @@ class UpgradeManager:
         elif upg is UpgradeType.PASSIVE_INCOME:
             self.passive_income += 0.015
 
+    def try_buy(self, upg: UpgradeType) -> bool:
+        cost = self.cost(upg)
+        if self.p.money < cost:
+            return False
+        self.p.money -= cost
+        self.apply(upg)
+        return True
+
     def update_passives(self):
         self.p.money += self.passive_income
         if 0 < self.p.health < self.p.max_health:
@@ -130,14 +139,12 @@ class UpgradeMenu:
     def handle_mouse(self, pos, player):
         for rect, upg in self.buttons:
             if rect.collidepoint(pos):
-                cost = self.mgr.cost(upg)
-                if player.money >= cost:
-                    player.money -= cost
-                    self.mgr.apply(upg)
+                if self.mgr.try_buy(upg):
                     self._flash(f"{LABELS[upg]} purchased", True)
-                else:
-                    self._flash("Not enough money", False)
+                    return upg
+                self._flash("Not enough money", False)
                 break
+        return None
 
     def _flash(self, txt, success):
         self.message, self.good, self.timer = txt, success, 120
@@ -153,16 +160,15 @@ class UpgradeMenu:
         mx, my = WIDTH // 2 - self.W // 2, HEIGHT // 2 - self.H // 2
         panel = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
         panel.fill((0, 0, 0, 230))
-        surf.blit(panel, (mx, my))
-        font = pygame.font.Font(self.FONT, 18)
+        area = surf.blit(panel, (mx, my))
         cx   = mx + self.W // 2
         y    = my + 28
-        title = font.render("UPGRADES", True, (255, 255, 0))
+        title = Text.render("UPGRADES", (255, 255, 0), 18, path=self.FONT)
         surf.blit(title, title.get_rect(center=(cx, y)))
         y += 32
         self.buttons.clear()
         for cat in CATEGORIES:
-            hdr = font.render(f"[ {cat['label']} ]", True, (140, 210, 255))
+            hdr = Text.render(f"[ {cat['label']} ]", (140, 210, 255), 18, path=self.FONT)
             surf.blit(hdr, (mx + self.PAD, y))
             y += self.ROW_H
             for upg in cat["upgrades"]:
@@ -170,26 +176,27 @@ class UpgradeMenu:
                 inc  = self._inc_token(upg)
                 cost = self.mgr.cost(upg)
                 line_txt = f"{LABELS[upg]:<16} Lv{lvl:<2} {inc:<6} ${cost:<3}"
-                line_surf = font.render(line_txt, True, (255, 255, 255))
+                line_surf = Text.render(line_txt, (255, 255, 255), 18, path=self.FONT)
                 surf.blit(line_surf, (mx + self.PAD, y))
                 btn_rect = pygame.Rect(
                     mx + self.W - self.PAD - self.BTN, y - 2,
                     self.BTN, self.BTN
                 )
                 pygame.draw.rect(surf, (45, 170, 60), btn_rect, border_radius=7)
-                plus_surf = font.render("+", True, (255, 255, 255))
+                plus_surf = Text.render("+", (255, 255, 255), 18, path=self.FONT)
                 surf.blit(plus_surf, plus_surf.get_rect(center=btn_rect.center))
                 self.buttons.append((btn_rect, upg))
                 y += self.ROW_H
             y += 12
         footer = pygame.Rect(mx, my + self.H - 54, self.W, 54)
         pygame.draw.rect(surf, (20, 20, 20), footer)
-        cash_surf = font.render(f"Money {int(player.money)}", True, (255, 255, 0))
+        cash_surf = Text.render(f"Money {int(player.money)}", (255, 255, 0), 18, path=self.FONT)
         surf.blit(cash_surf, (mx + self.PAD, footer.y + 16))
         if self.message:
             color = (40, 255, 40) if self.good else (255, 70, 70)
-            msg_surf = font.render(self.message, True, color)
+            msg_surf = Text.render(self.message, color, 18, path=self.FONT)
             surf.blit(msg_surf, msg_surf.get_rect(center=(mx + self.W // 2, footer.y + 16)))
+        return area
 
     def _inc_token(self, upg: UpgradeType) -> str:
         return {
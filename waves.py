@@ -145,3 +145,27 @@ WAVES = [
         "spawn_rate": 38,
     },
 ]
+
+
+# ─────────────────────────── endless mode ─────────────────────────────────
+ENDLESS_MIX = ("triangle", "square", "star", "fodder")
+
+def endless_wave(index):
+    """
+    Procedural wave ``index`` (past the hand-written list) for endless mode:
+    the same types and tiers, ~20% more enemies every wave without bound,
+    spawning faster, and bosses every fifth wave. Depends on ``index`` only.
+    """
+    n     = index - len(WAVES) + 1
+    total = int(40 * 1.2 ** n)
+    tier  = min(4, 2 + n // 4)
+    steps = [{"type": kind, "tier": tier if k % 2 == 0 else max(1, tier - 1),
+              "count": total // 4 + (k < total % 4)}
+             for k, kind in enumerate(ENDLESS_MIX)]
+    if n % 5 == 0:
+        steps.append({"type": "boss", "tier": 4, "count": n // 5})
+    return {"steps": steps, "reward": 150 + 10 * n, "spawn_rate": max(1, 36 - 2 * n)}
+
+def wave_def(index):
+    """``WAVES[index]``, or the endless wave past the end of the list."""
+    return WAVES[index] if index < len(WAVES) else endless_wave(index)